@@ -0,0 +1,424 @@
+"""
+Tools and utilities for the cache of github requests
+"""
+import os
+import os.path
+import pickle
+import time
+import zlib
+from collections import Counter
+from threading import Lock, Thread
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from requests import Response
+from requests_cache import CachedSession
+from requests_cache.backends.sqlite import SQLiteCache, SQLiteDict
+from requests_cache.models import CachedResponse
+from requests_cache.policy.expiration import get_expiration_datetime
+from requests_cache.serializers import SerializerPipeline, Stage
+from requests_cache.serializers.preconf import base_stage
+
+from ._config import cache_dir
+
+try:
+    # zstd is faster than zlib at a similar compression ratio, but it's optional
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# e.g. ~/.cache/dracula-cli/requests.sqlite on linux
+cache_path = os.path.join(cache_dir, "requests.sqlite")
+
+# Options for the sqlite databases, WAL mode lets multiple dracula processes read the cache while another one is
+# writing to it, and the busy timeout makes writers wait for each other instead of failing with "database is locked"
+SQLITE_OPTIONS = {"wal": True, "busy_timeout": 30_000}
+
+# The least recently used responses are deleted when the cache gets bigger than this, in megabytes
+max_cache_size = int(os.environ.get("DRACULA_CACHE_MAX_SIZE", 100)) * 1024 ** 2
+
+# Responses saying that an app or a file doesn't exist (404 Not Found and 410 Gone) are cached for this many
+# seconds instead of the expiration of their url, so that looking them up again doesn't need a request
+missing_expire_after = int(os.environ.get("DRACULA_CACHE_MISSING_TTL", 21_600))
+MISSING_STATUS_CODES = (404, 410)
+
+# The algorithm used for compressing the cached response bodies, either zstd, zlib or none
+compression = os.environ.get("DRACULA_CACHE_COMPRESSION", "zstd" if zstandard else "zlib")
+# Url patterns (see get_url_pattern) of responses that are stored uncompressed, separated by commas
+uncompressed_patterns = set(filter(None, os.environ.get("DRACULA_CACHE_UNCOMPRESSED", "").split(",")))
+
+
+class CompressionStage:
+    """A serializer stage that compresses the bodies of unstructured responses
+
+    The body is replaced with the compressed body and the algorithm is stored next to it,
+    so responses cached before compression was used or with a different algorithm still work
+
+    Parameters
+    ----------
+    algorithm : str
+        The compression algorithm, either zstd, zlib or none
+    threshold : int, optional
+        Bodies smaller than this amount of bytes aren't worth the cpu time to compress, by default 1024
+    exclude : Collection[str], optional
+        Url patterns (see get_url_pattern) of responses that shouldn't be compressed, by default none
+    """
+
+    def __init__(self, algorithm: str, threshold: int = 1024, exclude: Collection[str] = ()):
+        if algorithm not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unknown compression algorithm {algorithm!r}, valid options are zstd,zlib,none")
+        if algorithm == "zstd" and zstandard is None:
+            raise ValueError("zstd compression needs the zstandard package, install it with pip install zstandard")
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.exclude = exclude
+
+    def copy(self) -> "CompressionStage":
+        return CompressionStage(self.algorithm, self.threshold, self.exclude)
+
+    def dumps(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        content = response.get("_content")
+        if (
+            self.algorithm == "none"
+            or not content
+            or len(content) < self.threshold
+            or get_url_pattern(response["url"]) in self.exclude
+        ):
+            return response
+        if self.algorithm == "zstd":
+            content = zstandard.compress(content)
+        else:
+            content = zlib.compress(content)
+        return {**response, "_content": content, "_compression": self.algorithm}
+
+    def loads(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        algorithm = response.pop("_compression", None)
+        if algorithm == "zstd":
+            # If zstandard was uninstalled, this ImportError makes requests-cache treat the response as not cached
+            if zstandard is None:
+                raise ImportError("zstandard is needed to read this cached response")
+            response["_content"] = zstandard.decompress(response["_content"])
+        elif algorithm == "zlib":
+            response["_content"] = zlib.decompress(response["_content"])
+        return response
+
+
+def compressed_serializer(algorithm: str, **kwargs) -> SerializerPipeline:
+    """Create a serializer which pickles responses like the default one, after compressing their bodies
+
+    Parameters
+    ----------
+    algorithm : str
+        The compression algorithm, either zstd, zlib or none
+    **kwargs
+        Options for :class:`CompressionStage`
+    """
+    return SerializerPipeline(
+        [base_stage, CompressionStage(algorithm, **kwargs), Stage(pickle)],
+        name=f"pickle+{algorithm}",
+        is_binary=True,
+    )
+
+
+class DraculaCache(SQLiteCache):
+    """A sqlite cache that expires the responses for missing resources separately from the other responses
+
+    requests-cache only supports expiring responses by their url, and the same url can be missing for some
+    repositories and not for others, e.g. INSTALL.md
+
+    Parameters
+    ----------
+    db_path : str
+        The path of the sqlite database
+    missing_expire_after : int
+        How many seconds the responses for missing resources are cached for
+    refresh_missing : bool, optional
+        Whether to ignore the cached responses for missing resources so that they are requested again, by default
+        False
+    **kwargs
+        Options for :class:`SQLiteCache`
+    """
+
+    def __init__(self, db_path: str, missing_expire_after: int, refresh_missing: bool = False, **kwargs):
+        super().__init__(db_path, **kwargs)
+        self.missing_expire_after = missing_expire_after
+        self.refresh_missing = refresh_missing
+
+    def get_response(self, key: str, default=None) -> Optional[CachedResponse]:
+        response = super().get_response(key, default)
+        if self.refresh_missing and response is not None and response.status_code in MISSING_STATUS_CODES:
+            return default
+        return response
+
+    def save_response(self, response: Response, cache_key: Optional[str] = None, expires=None) -> None:
+        if response.status_code in MISSING_STATUS_CODES:
+            expires = get_expiration_datetime(self.missing_expire_after)
+        super().save_response(response, cache_key, expires)
+
+
+class DraculaSession(CachedSession):
+    """A cached session that keeps statistics about the cache, limits it's size, and keeps track of the requests
+    refreshing stale responses in the background
+
+    When stale_while_revalidate is enabled, a stale response is returned straight away and a request is sent in a
+    separate thread to refresh it. Those threads are daemon threads so that the process doesn't hang on a slow
+    connection, which means :meth:`finish` needs to be called before exiting.
+    """
+
+    def __init__(self, cache_path: str, missing_expire_after: int = missing_expire_after, **kwargs):
+        # These are stored in the same database as the responses, with the same options
+        sqlite_options = {key: value for key, value in kwargs.items() if key in SQLITE_OPTIONS}
+        cache = DraculaCache(
+            cache_path, missing_expire_after, serializer=kwargs.pop("serializer", None), **sqlite_options
+        )
+        super().__init__(backend=cache, **kwargs)
+        self._refreshes: List[Thread] = []
+        # Expired responses are revalidated with If-None-Match/If-Modified-Since by requests-cache,
+        # this also keeps track of how many of them github responded to with 304 Not Modified
+        self.statistics = CacheStatistics(self.cache.db_path, **sqlite_options)
+        # The cache size is capped by deleting the least recently used responses
+        self.least_recently_used = LeastRecentlyUsed(self.cache, **sqlite_options)
+        self.hooks["response"] += [self.statistics.record, self.least_recently_used.record]
+
+    def _resend_async(self, *args, **kwargs):
+        thread = Thread(target=self._send_and_cache, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        self._refreshes.append(thread)
+
+    def wait_for_refreshes(self, timeout: float = 10) -> None:
+        """Wait for the background refreshes to finish
+
+        Parameters
+        ----------
+        timeout : float, optional
+            How many seconds to wait for all the refreshes in total, by default 10
+        """
+        deadline = time.monotonic() + timeout
+        for thread in self._refreshes:
+            thread.join(max(deadline - time.monotonic(), 0))
+
+    def finish(self, max_size: int) -> None:
+        """Wait for the background refreshes and save the information about this run, this should be called before
+        exiting
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum size of the cache in bytes, the least recently used responses are deleted to stay below it
+        """
+        self.wait_for_refreshes()
+        self.statistics.save()
+        self.least_recently_used.save()
+        self.least_recently_used.evict(max_size)
+
+
+class CacheStatistics:
+    """Counts how the requests were handled by the cache and keeps the totals in the cache database
+
+    Parameters
+    ----------
+    db_path : str
+        The path of the sqlite database used by the requests cache
+    **kwargs
+        Options for the sqlite database
+    """
+
+    def __init__(self, db_path: str, **kwargs):
+        # The totals are stored as plain integers in their own table next to the cached responses
+        self._totals = SQLiteDict(db_path, table_name="statistics", serializer=None, **kwargs)
+        self._counter: Counter = Counter()
+        self._lock = Lock()
+
+    def record(self, response: Response, *args, **kwargs) -> Response:
+        """A response hook for counting the cache hits, misses and the responses that were revalidated
+
+        An expired response that has an ETag or Last-Modified header is revalidated by sending a conditional
+        request. If github responds with 304 Not Modified then the body of the cached response is reused, and
+        github doesn't count the request against the ratelimit.
+        """
+        # Hooks also run for the plain response received from github before it's wrapped by requests-cache,
+        # those are skipped so that each request is only counted once
+        if not hasattr(response, "from_cache"):
+            return response
+        with self._lock:
+            if getattr(response, "revalidated", False):
+                self._counter["revalidated"] += 1
+                self._counter["revalidated_bytes"] += len(response.content)
+            # The 504 responses for requests missing from the cache in offline mode don't have a cache key
+            elif response.from_cache and response.cache_key:
+                self._counter["hits"] += 1
+            else:
+                self._counter["misses"] += 1
+        return response
+
+    def save(self) -> None:
+        """Add the counts of this run to the totals stored in the database"""
+        with self._lock:
+            table = self._totals.table_name
+            # The totals are increased by the database in one transaction (requests-cache begins it), reading and
+            # writing them back would lose the counts of other processes saving theirs at the same time
+            with self._totals.connection(commit=True) as connection:
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO {table} (key, value) VALUES (?, 0)", [(key,) for key in self._counter]
+                )
+                connection.executemany(
+                    f"UPDATE {table} SET value = value + ? WHERE key = ?",
+                    [(value, key) for key, value in self._counter.items()],
+                )
+            self._counter.clear()
+
+    def totals(self) -> Dict[str, int]:
+        """Get the totals of every run, including this one
+
+        Returns
+        -------
+        Dict[str, int]
+            A mapping of the statistic name to it's total
+        """
+        totals = Counter(dict(self._totals.items()))
+        with self._lock:
+            totals.update(self._counter)
+        return totals
+
+
+class LeastRecentlyUsed:
+    """Keeps track of when each cached response was last used, to delete the least recently used responses when the
+    cache gets too big
+
+    Parameters
+    ----------
+    cache : SQLiteCache
+        The cache of the session
+    **kwargs
+        Options for the sqlite database
+    """
+
+    def __init__(self, cache: SQLiteCache, **kwargs):
+        self._cache = cache
+        # Maps cache keys to the unix timestamp of when they were last used
+        self._accessed = SQLiteDict(cache.db_path, table_name="accessed", serializer=None, **kwargs)
+        self._recent: Dict[str, float] = {}
+
+    def record(self, response: Response, *args, **kwargs) -> Response:
+        """A response hook for remembering when a cached response was used"""
+        cache_key = getattr(response, "cache_key", None)
+        if cache_key:
+            self._recent[cache_key] = time.time()
+        return response
+
+    def save(self) -> None:
+        """Save the access times of this run to the database in a single transaction"""
+        recent, self._recent = self._recent, {}
+        with self._accessed.bulk_commit():
+            for cache_key, accessed in recent.items():
+                self._accessed[cache_key] = accessed
+
+    def size(self) -> int:
+        """Get the amount of bytes used by the cache database, excluding free pages which are reused for new data"""
+        with self._cache.responses.connection() as con:
+            page_count = con.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = con.execute("PRAGMA freelist_count").fetchone()[0]
+            page_size = con.execute("PRAGMA page_size").fetchone()[0]
+        return (page_count - freelist_count) * page_size
+
+    def evict(self, max_size: int) -> int:
+        """Delete the least recently used responses until the cache is smaller than the given size
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum size of the cache in bytes
+
+        Returns
+        -------
+        int
+            The amount of responses that were deleted
+        """
+        excess = self.size() - max_size
+        if excess <= 0:
+            return 0
+        keys = []
+        with self._cache.responses.connection() as con:
+            # Responses that were cached before the access times were tracked are considered the least recently used
+            rows = con.execute(
+                f"SELECT responses.key, LENGTH(responses.value) FROM {self._cache.responses.table_name} responses"
+                f" LEFT JOIN {self._accessed.table_name} accessed ON accessed.key = responses.key"
+                f" ORDER BY COALESCE(accessed.value, 0)"
+            )
+            for cache_key, size in rows:
+                if excess <= 0:
+                    break
+                keys.append(cache_key)
+                excess -= size
+        self._cache.delete(*keys, vacuum=False)
+        self._accessed.bulk_delete(keys)
+        return len(keys)
+
+    def forget_deleted(self) -> None:
+        """Forget the access times of responses that are no longer in the cache"""
+        with self._accessed.connection(commit=True) as con:
+            con.execute(
+                f"DELETE FROM {self._accessed.table_name}"
+                f" WHERE key NOT IN (SELECT key FROM {self._cache.responses.table_name})"
+            )
+
+
+def get_url_pattern(url: str) -> str:
+    """Get a pattern for a url that groups it together with similar urls
+
+    Parameters
+    ----------
+    url : str
+        The url to get the pattern of e.g. https://api.github.com/repos/dracula/vim/readme
+
+    Returns
+    -------
+    str
+        The pattern of the url e.g. api.github.com/repos/dracula/{app}/readme
+    """
+    parsed = urlparse(url)
+    parts = parsed.path.strip("/").split("/")
+    if parsed.netloc == "api.github.com" and parts[0] == "repos" and len(parts) >= 3:
+        parts = ["repos", parts[1], "{app}", *parts[3:4], *(["{path}"] if len(parts) > 4 else [])]
+    elif parsed.netloc == "raw.githubusercontent.com" and len(parts) >= 4:
+        # The demo files are all in the template repository
+        parts = [parts[0], parts[1] if parts[1] == "template" else "{app}", "{branch}", "{path}"]
+    return f"{parsed.netloc}/{'/'.join(parts)}"
+
+
+def group_by_url_pattern(responses: Iterable[CachedResponse]) -> Dict[str, Tuple[int, int]]:
+    """Group cached responses by the pattern of their url
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        A mapping of the url pattern to the amount of responses and their total size in bytes
+    """
+    groups: Dict[str, Tuple[int, int]] = {}
+    for response in responses:
+        pattern = get_url_pattern(response.url)
+        count, size = groups.get(pattern, (0, 0))
+        groups[pattern] = (count + 1, size + response.size)
+    return groups
+
+
+if __name__ == "__main__":
+    # Compare the compression algorithms on the cached responses, `dracula cache warm` beforehand
+    # for a cache containing the whole dracula organization
+    import sys
+
+    cache = SQLiteCache(sys.argv[1] if sys.argv[1:] else cache_path, serializer=compressed_serializer("none"))
+    responses = [response for response in cache.responses.values() if response is not None]
+    print(f"{len(responses)} responses in {cache.db_path}")
+    for algorithm in ("none", "zlib", *(["zstd"] if zstandard else [])):
+        serializer = compressed_serializer(algorithm)
+        serialized = [serializer.dumps(response) for response in responses]
+        start = time.perf_counter()
+        for value in serialized:
+            serializer.loads(value)
+        elapsed = time.perf_counter() - start
+        size = sum(len(value) for value in serialized)
+        print(
+            f"{algorithm:>5}: {size / 1024 ** 2:8.2f} MB stored,"
+            f" {elapsed * 1000:8.2f} ms to read everything ({elapsed / max(len(responses), 1) * 1e6:.1f} us per response)"
+        )
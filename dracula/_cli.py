@@ -1,90 +1,102 @@
-import datetime as dt
-import math
-import os
-import os.path
-from typing import List, Optional
-
-import click
-import humanize
-import questionary
-import rich
+"""
+The main command of the cli and the helpers shared by it's commands
+
+The commands are in the _commands package and are only imported when they are used. The helpers import their
+dependencies inside of them too, since dracula is often run many times by scripts and most of the dependencies
+are only needed by one or two commands, e.g. `dracula --help` doesn't need any of them
+"""
+import atexit
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
 import typer
-from pygments.lexers import ClassNotFound, guess_lexer_for_filename
-from prompt_toolkit.shortcuts.prompt import CompleteStyle
-from questionary import Style
-from requests_cache import CachedSession
-from rich.align import Align
-from rich.box import HEAVY_EDGE
-from rich.columns import Columns
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, track
-from rich.rule import Rule
-from rich.syntax import Syntax
-from rich.text import Text
-from rich.traceback import install
-from rich.tree import Tree
-
-from ._colors import format_language
+
+from ._config import load_config
+from ._repo import Repo
 from ._typer import Typer
-from ._utils import get_closest_clock_emoji, datetime_from_utc_to_local
-from ._downloader import download_files
+
+if TYPE_CHECKING:
+    from requests import Response
+    from rich.tree import Tree
+
+    from ._cache import DraculaSession
+    from ._index import RepoIndex
+
+
+def _format_error(response) -> str:
+    """Format the status code and the error message of a failed response"""
+    try:
+        message = response.json().get("message", None)
+    except Exception:
+        # Responses that aren't from the github api, and the responses for requests missing from
+        # the cache in offline mode, don't have a json body so their reason is used instead
+        message = response.reason
+    return f"Error {response.status_code}{f': {message}' if message else ''}"
+
+
+def _request_github_readme(repo: str) -> "Response":
+    """Request the github readme contents for a particular repository"""
+    # With the raw media type github sends the contents of the readme instead of it's path, so the readme of the
+    # default branch is downloaded in one request no matter what the file is called
+    return get_session().get(
+        f"https://api.github.com/repos/{repo}/readme", headers={"Accept": "application/vnd.github.raw"}
+    )
 
 
 def _get_github_readme(repo: str) -> Optional[str]:
     """Get the github readme contents for a particular repository"""
-    # Get the readme path from github since the readme file and extension is case insensitive
-    readme = session.get(f"https://api.github.com/repos/{repo}/readme").json()
-    if readme.get("message") == "Not Found":
-        return
-    # Get the contents of the readme file
-    content = session.get(f"https://raw.githubusercontent.com/{repo}/master/{readme['path']}")
-    if content.status_code == 200:
-        return content.text
+    response = _request_github_readme(repo)
+    if response.status_code == 200:
+        return response.text
     return
 
 
-def _get_install_guide(repo: str) -> Optional[str]:
-    """Get the install guide for a particular dracula supported app"""
+def _get_default_branch(repo: str) -> str:
+    """Get the default branch of a repository, which is needed for the raw urls of it's files
+
+    The branch is taken from the index if the repository is in it, otherwise from the repository's information which
+    is then added to the index
+    """
+    from ._index import RepoIndex
+
+    index = RepoIndex()
+    indexed_repo = index.get(repo.split("/", 1)[1])
+    if indexed_repo is not None and indexed_repo.default_branch:
+        return indexed_repo.default_branch
+    response = get_session().get(f"https://api.github.com/repos/{repo}")
+    if response.status_code != 200:
+        # Most of the older dracula repositories still use master
+        return "master"
+    found_repo = Repo.from_rest(response.json())
+    index.update([found_repo])
+    return found_repo.default_branch or "master"
+
+
+def _request_install_guide(repo: str, branch: Optional[str] = None) -> "Response":
+    """Request the install guide of a dracula supported app, from it's default branch if no branch is given"""
+    branch = branch or _get_default_branch(repo)
     # Since each repo has a INSTALL.md file with instructions, we can safely get the contents of the INSTALL.md file
-    content = session.get(f"https://raw.githubusercontent.com/{repo}/master/INSTALL.md")
+    return get_session().get(f"https://raw.githubusercontent.com/{repo}/{branch}/INSTALL.md")
+
+
+def _get_install_guide(repo: str, branch: Optional[str] = None) -> Optional[str]:
+    """Get the install guide for a particular dracula supported app, from it's default branch if no branch is given"""
+    content = _request_install_guide(repo, branch)
     if content.status_code == 200:
         return content.text
     return
 
 
-def _generate_formatted_time(iso_8601_time: Optional[str], title: str, delta_first: bool = True) -> str:
-    """Convert a datetime object to a human readable time"""
-    # Parse the time given to us
-    if iso_8601_time:
-        time = dt.datetime.strptime(iso_8601_time, "%Y-%m-%dT%H:%M:%SZ")
-    else:
-        time = dt.datetime.fromtimestamp(0)
-    # Get the clock emoji that most closely matches the time given
-    closest_clock_emoji = get_closest_clock_emoji(time)
-    # Calculate the amount of time that has passed since the time given
-    delta = dt.datetime.now() - time
-    # Depending on the use case, the delta may need to be shown before the absolute time
-    if delta_first:
-        return f"{closest_clock_emoji} {title}:" \
-               f" {humanize.naturaldelta(delta)} ago ({humanize.naturaldate(datetime_from_utc_to_local(time))})\n"
-    else:
-        return f"{closest_clock_emoji} {title}:" \
-               f"{humanize.naturaldate(datetime_from_utc_to_local(time))} ({humanize.naturaldelta(delta)})\n"
-
-
 def _generate_contributors_data(url: str) -> str:
     """Get the contributors of a repository given it's api url"""
+    session = get_session()
     response = session.get(url)
     if response.status_code != 200:
-        try:
-            response_json = response.json()
-        except Exception:
-            message = None
-        else:
-            message = response_json.get("message", None)
-        return f"Could not get contributors, Error {response.status_code}{f': {message}' if message else ''}"
+        return f"Could not get contributors, {_format_error(response)}"
     response_json = response.json()
     # SOrt the list by the amount of contributions
     contributors = sorted(response_json, key=lambda d: d["contributions"])
@@ -96,19 +108,184 @@ def _generate_contributors_data(url: str) -> str:
     )
 
 
-def _get_org_repo_count(org_name: str) -> int:
-    """Get how many apps are supported by dracula"""
-    url = f"https://api.github.com/orgs/{org_name}"
-    response = session.get(url)
-    if response.status_code != 200:
-        # 300 is a fallback since it should be less than 300 for a couple of months
-        return 300
-    response_json = response.json()
-    return response_json.get("public_repos", 300)
+def _get_page_count(response) -> int:
+    """Get the amount of pages of a paginated github api response using it's Link header"""
+    last = response.links.get("last")
+    if last is None:
+        # Github doesn't send a link to the last page if there is only one page
+        return 1
+    return int(parse_qs(urlparse(last["url"]).query)["page"][0])
+
+
+def _iter_org_repo_pages(org_name: str, jobs: int = 8, sort: str = "created") -> Iterator[Tuple[int, List[Repo]]]:
+    """Download the repositories of a github organization using the REST API
+
+    Each page is yielded together with the total amount of pages as soon as it and all the pages before it are
+    downloaded, so the repositories are yielded in the same order github returns them. With a sort of "full_name"
+    that is A-Z
+    """
+    from rich.panel import Panel
 
+    session = get_session()
+    url = f"https://api.github.com/orgs/{org_name}/repos"
+    # The github API can only return 100 results per page
+    params = {"per_page": 100, "sort": sort, "direction": "asc"}
 
-def _render_tree(repo:str, file_list, path: str =".") -> Tree:
+    def get_repos(response) -> List[Repo]:
+        if response.status_code != 200:
+            error_console.print(
+                Panel(
+                    _format_error(response),
+                    title="Could not load",
+                    border_style="#ff5555",
+                    title_align="left",
+                )
+            )
+            raise typer.Exit(1)
+        return [Repo.from_rest(repo) for repo in response.json()]
+
+    # The first page tells us how many pages there are in total through it's Link header
+    first_page = session.get(url, params={**params, "page": 1})
+    page_count = _get_page_count(first_page)
+    yield page_count, get_repos(first_page)
+    # The rest of the pages don't depend on each other so they can all be downloaded at the same time
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(session.get, url, params={**params, "page": page}) for page in range(2, page_count + 1)]
+        try:
+            for future in futures:
+                yield page_count, get_repos(future.result())
+        finally:
+            # The pages that haven't started downloading aren't needed if the caller stopped early
+            for future in futures:
+                future.cancel()
+
+
+def _get_org_repos(org_name: str, jobs: int = 8) -> List[Repo]:
+    """Get all the repositories of a github organization using the REST API"""
+    from rich.progress import Progress
+
+    repos = []
+    with Progress(transient=True) as progress:
+        loading_task = progress.add_task("[#ff5555]Loading...", total=None)
+        for page_count, page in _iter_org_repo_pages(org_name, jobs=jobs):
+            progress.update(loading_task, total=page_count, advance=1)
+            repos.extend(page)
+    return repos
+
+
+# Only the fields that are shown by the `all` command, the REST API sends dozens of urls for every repository
+_ORG_REPOS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor, privacy: PUBLIC, orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        diskUsage
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        licenseInfo { name }
+        createdAt
+        updatedAt
+        pushedAt
+        defaultBranchRef { name }
+      }
+    }
+  }
+}
+"""
+
+
+def _get_org_repos_graphql(org_name: str) -> Optional[List[Repo]]:
+    """Get all the repositories of a github organization using the GraphQL API
+
+    None is returned if the GraphQL API could not be used
+    """
+    session = get_session()
+    repos = []
+    cursor = None
+    while True:
+        response = session.post(
+            "https://api.github.com/graphql",
+            json={"query": _ORG_REPOS_QUERY, "variables": {"org": org_name, "cursor": cursor}},
+        )
+        if response.status_code != 200:
+            return
+        response_json = response.json()
+        # GraphQL errors are sent with a 200 status code
+        if response_json.get("errors") or not response_json["data"].get("organization"):
+            return
+        repositories = response_json["data"]["organization"]["repositories"]
+        repos.extend(map(Repo.from_graphql, repositories["nodes"]))
+        if not repositories["pageInfo"]["hasNextPage"]:
+            return repos
+        cursor = repositories["pageInfo"]["endCursor"]
+
+
+def _get_index(jobs: int = 8, graphql: bool = True) -> "RepoIndex":
+    """Get the index of the dracula repositories, after refreshing it
+
+    The whole index is downloaded if it's incomplete or old, otherwise only the repositories that changed since the
+    last refresh are downloaded. If that fails, e.g. in offline mode, the index is used as it is
+    """
+    from ._index import RepoIndex
+
+    index = RepoIndex()
+    if index.is_complete():
+        _update_index(index)
+        return index
+    session = get_session()
+    repos = None
+    # The GraphQL API needs a token, but when there is one it only sends the fields that are actually shown
+    if graphql and "Authorization" in session.headers:
+        with console.status("Loading apps"):
+            repos = _get_org_repos_graphql("dracula")
+    if repos is None:
+        repos = _get_org_repos("dracula", jobs=jobs)
+    index.replace(repos)
+    return index
+
+
+def _update_index(index: "RepoIndex") -> None:
+    """Download the repositories that changed since the index was last refreshed
+
+    Github can sort the repositories by when they were last pushed to or updated (which includes e.g. new stars), so
+    the pages are downloaded from the latest until one has a repository that is already up to date in the index.
+    Usually that's the first page
+    """
+    session = get_session()
+    url = "https://api.github.com/orgs/dracula/repos"
+    # Both watermarks are read first, since the repositories downloaded for one sort order raise the watermark of the
+    # other one and would stop it before the repositories that only changed in that field
+    orders = (("pushed_at", "pushed"), ("updated_at", "updated"))
+    watermarks = [(field, sort, index.latest(field)) for field, sort in orders]
+    for field, sort, latest in watermarks:
+        page = 1
+        while True:
+            # Most of the time only a few repositories changed, so small pages are used
+            response = session.get(url, params={"per_page": 20, "sort": sort, "direction": "desc", "page": page})
+            if response.status_code != 200:
+                return
+            repos = [Repo.from_rest(repo) for repo in response.json()]
+            index.update(repos)
+            if "next" not in response.links or any(
+                latest is not None and getattr(repo, field) is not None and getattr(repo, field) <= latest
+                for repo in repos
+            ):
+                break
+            page += 1
+
+
+def _render_tree(repo:str, file_list, path: str =".") -> "Tree":
     """Render a git repo's files in a tree"""
+    from rich.text import Text
+    from rich.tree import Tree
+
+    session = get_session()
     url = f"https://api.github.com/repos/{repo}/contents/{path}"
     response = session.get(url)
     response_json = response.json()
@@ -133,25 +310,120 @@ def _render_tree(repo:str, file_list, path: str =".") -> Tree:
     return tree
 
 
-# A folder called requests in a folder called cache inside the install directory
-cache_path = os.path.join(os.path.dirname(__file__), "cache", "requests")
+# These apps are not in the official dracula website.
+# FIXME: Switch to parsing paths.js (https://github.com/dracula/draculatheme.com/blob/site/lib/paths.js)
+NOT_APPS = {
+    "dracula-theme",
+    "atom-ui",
+    "chrome-devtools",
+    "draculatheme.com",
+    "jetbrains-legacy",
+    "liteide-archived",
+    "template",
+    "spec",
+    "jupyterlab_dracula",
+    "racket",
+    "react-devtools",
+    "putty",
+    "slate",
+}
+
+# fmt: off
+# A list of all available demo files
+DEMO_URLS = [
+    f"https://raw.githubusercontent.com/dracula/template/master/sample/dracula.{ext}"
+    for ext in ('c', 'c++', 'clj', 'cs', 'css', 'dart', 'ex', 'go', 'html',
+                'java', 'js', 'kt', 'md', 'php', 'py', 'rb', 'rs', 'scala',
+                'sml', 'swift', 'ts')
+]
+# fmt: on
 
 # Autocompletion is mostly unnecessary in this case
-app = Typer(add_completion=False)
-console = Console()
-session = CachedSession(
-    cache_path,
-    backend="sqlite",
-    urls_expire_after={
-        "https://api.github.com/repo": 21_600,  # 6 hours
-        "https://api.github.com/orgs": 10_800,  # 3 hours
-        "https://api.github.com/contributors": 86_400,  # 24 hours
-        "https://raw.githubusercontent.com/dracula/template/master/sample": 7_890_000,  # 3 months
-        "https://raw.githubusercontent.com/dracula/*": 86_400,  # 24 hours
+app = Typer(
+    add_completion=False,
+    context_settings={"default_map": load_config()},
+    # The name, import path and short help of every command, the commands are only imported when they are used
+    lazy_commands={
+        "all": ("dracula._commands.all:app", "View all dracula supported apps"),
+        "show": ("dracula._commands.show:app", "View the documentation for the dracula theme for specific apps"),
+        "demo": ("dracula._commands.demo:app", "View an approximate demonstration of the dracula theme"),
+        "download": ("dracula._commands.download:app", "Download files for a theme to a specific folder"),
+        "cache": ("dracula._commands.cache:app", "Manage the cache used for github requests"),
     },
-    headers={"User-Agent": "wasi_master/dracula-cli"},
 )
-install()  # Install rich traceback
+console = Console()
+# Errors are written to stderr, so that they don't end up in the middle of machine readable output
+error_console = Console(stderr=True)
+# The session is created the first time it's needed by get_session, so that things like `dracula --help`
+# don't have to open the cache database. The main callback stores the settings for it here
+_session: Optional["DraculaSession"] = None
+_session_lock = Lock()
+_session_settings = {}
+
+
+def get_session() -> "DraculaSession":
+    """Get the session used for every github request, it's created the first time this is called"""
+    global _session
+    # The lock is needed since the session can be first used from multiple threads at the same time
+    with _session_lock:
+        if _session is None:
+            _session = _create_session(**_session_settings)
+    return _session
+
+
+def _create_session(
+    token: Optional[str] = None, stale_ok: bool = False, offline: bool = False, refresh: bool = False
+) -> "DraculaSession":
+    """Create the session used for every github request"""
+    from ._cache import (
+        MISSING_STATUS_CODES,
+        SQLITE_OPTIONS,
+        DraculaSession,
+        cache_path,
+        compressed_serializer,
+        compression,
+        max_cache_size,
+        uncompressed_patterns,
+    )
+
+    session = DraculaSession(
+        cache_path,
+        urls_expire_after={
+            "https://api.github.com/repo": 21_600,  # 6 hours
+            "https://api.github.com/orgs": 10_800,  # 3 hours
+            "https://api.github.com/graphql": 10_800,  # 3 hours
+            "https://api.github.com/contributors": 86_400,  # 24 hours
+            "https://raw.githubusercontent.com/dracula/template/master/sample": 7_890_000,  # 3 months
+            "https://raw.githubusercontent.com/dracula/*": 86_400,  # 24 hours
+        },
+        # GraphQL queries are sent as POST requests, the query is part of the cache key
+        allowable_methods=("GET", "HEAD", "POST"),
+        # Missing apps and files are cached as well, with their own expiration
+        allowable_codes=(200, *MISSING_STATUS_CODES),
+        headers={"User-Agent": "wasi_master/dracula-cli"},
+        serializer=compressed_serializer(compression, exclude=uncompressed_patterns),
+        **SQLITE_OPTIONS,
+    )
+    if token:
+        session.headers.update({"Authorization": f"Token {token}"})
+    if stale_ok:
+        session.settings.stale_while_revalidate = True
+    if offline:
+        # Requests missing from the cache get a 504 response instead of being sent. Expired responses
+        # are still used since there is no way to refresh them
+        session.settings.only_if_cached = True
+        session.settings.stale_if_error = True
+    if refresh:
+        session.cache.refresh_missing = True
+    atexit.register(session.finish, max_cache_size)
+    return session
+
+
+def _show_traceback(exception_type, exception, traceback) -> None:
+    """Show an uncaught exception with rich, used as `sys.excepthook`"""
+    from rich.traceback import Traceback
+
+    error_console.print(Traceback.from_exception(exception_type, exception, traceback))
 
 
 @app.callback()
@@ -161,294 +433,21 @@ def main(
         envvar="GITHUB_TOKEN",
         help="Github access token for less ratelimits, Can be also set via the environment variable GITHUB_TOKEN",
     ),
-):
-    if token:
-        session.headers.update({"Authorization": f"Token {token}"})
-
-
-@app.command()
-def all(
-    sort: str = typer.Option(
-        "stars",
-        help="What to use when sorting repos, valid options are name,stars,forks,size,watchers,language,issues,created_at,updated_at,pushed_at",
+    stale_ok: bool = typer.Option(
+        False,
+        envvar="DRACULA_STALE_OK",
+        help="Whether to instantly show expired cached data while it is refreshed in the background for the next run",
+    ),
+    offline: bool = typer.Option(
+        False,
+        envvar="DRACULA_OFFLINE",
+        help="Whether to only use cached data and fail instead of sending requests, use `dracula cache warm` beforehand",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        help="Whether to request again the apps and files that were cached as missing, e.g. a file that was just added",
     ),
-    pager: bool = typer.Option(False, help="Whether to use pagination or not"),
-    tui: bool = typer.Option(False, help="Whether to use a textual use interface or not. Close by pressir Ctrl+C or q"),
-):
-    """
-    View all dracula supported apps
-
-    The output can sometimes be too big to be shown at once in some terminals,
-    to make sure this doesn't happen you can use the --pager flag or if you want the best of the best, use the --tui flag.
-    The --sort option can be used to sort the list of apps based on specific criterias
-    """
-    url = "https://api.github.com/orgs/dracula/repos"
-
-    with console.status("Getting app amount information"):
-        # Since the github API can only return 100 results per page.
-        # This gets the number of repositories that we need to retrieve
-        maximum = _get_org_repo_count("dracula")
-        per_page = 100
-
-    with Progress(transient=True) as progress:
-        apps = []
-        loading_task = progress.add_task("[#ff5555]Loading...", total=maximum)
-        # ceil the number of repositories divided by the number of repositories per page
-        # to get the number of api calls that we would need to make
-        for page in range(1, math.ceil(maximum / per_page)+1):
-            response = session.get(url, params={"per_page": per_page, "page": page})
-            if response.status_code != 200:
-                try:
-                    response_json = response.json()
-                except Exception:
-                    message = None
-                else:
-                    message = response_json.get("message", None)
-                console.print(
-                    Panel(
-                        f"Error {response.status_code}{f': {message}' if message else ''}",
-                        title="Could not load",
-                        border_style="#ff5555",
-                        title_align="left",
-                    )
-                )
-                raise typer.Exit()
-            response_json = response.json()
-            apps.extend(response_json)
-            progress.update(loading_task, advance=per_page)
-
-    columns = Columns()
-    # These apps are not in the official dracula website.
-    # FIXME: Switch to parsing paths.js (https://github.com/dracula/draculatheme.com/blob/site/lib/paths.js)
-    not_app = {
-        "dracula-theme",
-        "atom-ui",
-        "chrome-devtools",
-        "draculatheme.com",
-        "jetbrains-legacy",
-        "liteide-archived",
-        "template",
-        "spec",
-        "jupyterlab_dracula",
-        "racket",
-        "react-devtools",
-        "putty",
-        "slate",
-    }
-
-    # Mapping of sorting method to api response keys. If the sorting method is not
-    # in this list then the sorting method is used as the key
-    sort_aliases = {
-        "stars": "stargazers_count",
-        "star": "stargazers_count",
-        "watcher": "watchers",
-        "fork": "forks",
-        "issues": "open_issues",
-        "issue": "open_issues",
-    }
-    #fmt: off
-    apps = sorted(
-        apps,
-        # Available values: name, stars, forks, size, watchers, language, issues,
-        #                   created_at, updated_at, pushed_at
-        key=lambda d: d[sort_aliases.get(sort, sort)],
-        # Only do reversed sort for names since people usually want A-Z.
-        # for other things such as stars, people usually want highest to lowest
-        reverse=sort != "name",
-    )
-    #fmt: on
-
-    for repo in apps:
-        # If the repo does not exist in draculatheme.com then we don't show it
-        if repo["name"] in not_app:
-            continue
-        columns.add_renderable(
-            Panel(
-                (
-                    f":pinching_hand: Size: {humanize.naturalsize(repo.get('size', 0))}\n"
-                    f":star: Stars: {repo.get('stargazers_count', 0):,}\n"
-                    f":fork_and_knife: Forks: {repo.get('forks_count', 0):,}\n"
-                    f":eyes: Watchers: {repo.get('watchers_count', 0):,}\n"
-                    f":abc: Language: {format_language(repo.get('language', 'N/A'))}\n"
-                    f":bug: Issues Open: {repo.get('open_issues_count', 'N/A')}\n"
-                    f":scroll: License: {repo['license']['name'] if repo['license'] else 'Not Specified'}\n"
-                    + _generate_formatted_time(repo.get("created_at"), title="Created At", delta_first=False)
-                    + _generate_formatted_time(repo.get("updated_at"), title="Last updated")
-                    + _generate_formatted_time(repo.get("pushed_at"), title="Last pushed")
-                ),
-                title=f"[link=https://draculatheme.com/{repo.get('name')}]{repo.get('name')}[/]",
-            )
-        )
-    if pager and tui:
-        raise click.UsageError("You cannot use both a pager and a tui")
-    if pager:
-        with console.pager():
-            console.print(Rule(title=f"{len(apps)} Apps"))
-            console.print(columns)
-    elif tui:
-        from ._tui import DraculaColumnsApp
-
-        DraculaColumnsApp.run(title="All Apps", columns=columns)
-    else:
-        console.print(Rule(title=f"{len(apps)} Apps"))
-        console.print(columns)
-
-
-@app.command()
-def show(
-    app: str = typer.Argument(..., help="The name of the app to view"),
-    readme: bool = typer.Option(False, help="Whether to show the github readme page or not"),
-    installation: bool = typer.Option(True, help="Whether to show the installation guide or not"),
 ):
-    """
-    View the documentation for the dracula theme for a specific app
-
-    By default only the app git repository metadata and the installation instructions are shown. You can optionally
-    also ask for the readme.md file by using the --readme flag.
-    """
-    url = f"https://api.github.com/repos/dracula/{app}"
-
-    response = session.get(url)
-    if response.status_code != 200:
-        try:
-            response_json = response.json()
-        except Exception:
-            message = None
-        else:
-            message = response_json.get("message", None)
-        console.print(
-            Panel(
-                f"Error {response.status_code}{f': {message}' if message else ''}",
-                title=f"Could not get [#50fa7b]{app}[/]",
-                border_style="#ff5555",
-                title_align="left",
-            )
-        )
-        raise typer.Exit()
-    response_json = response.json()
-
-    console.print(
-        Align(
-            Panel(
-                (
-                    f":pinching_hand: Size: {humanize.naturalsize(response_json.get('size', 0))}\n"
-                    f":star: Stars: {response_json.get('stargazers_count', 0):,}\n"
-                    f":fork_and_knife: Forks: {response_json.get('forks_count', 0):,}\n"
-                    f":eyes: Watchers: {response_json.get('watchers_count', 0):,}\n"
-                    f":abc: Language: {format_language(response_json.get('language', 'N/A'))}\n"
-                    f":bug: Issues Open: {response_json.get('open_issues_count', 'N/A')}\n"
-                    f":scroll: License: {response_json['license']['name'] if response_json['license'] else 'Not Specified'}\n"
-                    + _generate_formatted_time(
-                        response_json.get("created_at", dt.datetime.fromtimestamp(0)),
-                        title="Created At",
-                        delta_first=False,
-                    )
-                    + _generate_formatted_time(
-                        response_json.get("updated_at", dt.datetime.fromtimestamp(0)), title="Last updated"
-                    )
-                    + _generate_formatted_time(
-                        response_json.get("pushed_at", dt.datetime.fromtimestamp(0)), title="Last pushed"
-                    )
-                    + _generate_contributors_data(response_json.get("contributors_url"))
-                ),
-                title=response_json.get("description", "").replace("🧛🏻‍♂️", ":vampire:"),
-                border_style="#8be9fd",
-                expand=False,
-                subtitle=f"https://draculatheme.com/{app}",
-            ),
-            "center",
-        )
-    )
-    # console.print(Rule(title="Installation Guide", characters="━"))
-    if installation:
-        with console.status("Getting installation guide"):
-            installation_guide = _get_install_guide(f"dracula/{app}")
-        console.print(
-            Panel(
-                Markdown(installation_guide, code_theme="dracula"),
-                title="[b u]Installation Guide[/]",
-                border_style="#50fa7b",
-                box=HEAVY_EDGE,
-            )
-        )
-    if readme:
-        with console.status("Getting github readme"):
-            github_readme = _get_github_readme(f"dracula/{app}")
-        console.print(
-            Panel(
-                Markdown(github_readme, code_theme="dracula"),
-                title="[b u]Readme[/]",
-                border_style="#ff79c6",
-                box=HEAVY_EDGE,
-            )
-        )
-    # If both readme and installation are false then there's nothing to show for detailed information.
-    # This may not be intentional, so it just informs the user
-    if (installation, readme) == (False, False):
-        console.print(Align("[bold #ff5555]You disabled both installation and readme.[/]", "center"))
-
-
-@app.command()
-def demo():
-    """
-    View an approximate demonstration of the dracula theme
-
-    The code shown here is same as the dracula template repo. To switch between different programming languages,
-    use the arrow keys left and right. To scroll you can use the mouse or the up and down arrow keys, the page-up and page-down keys
-    also work. To exit, press q
-    """
-    from ._tui import DraculaDemoApp
-
-    # fmt: off
-    # Generate a list of all available demo files
-    urls = [
-        f"https://raw.githubusercontent.com/dracula/template/master/sample/dracula.{ext}"
-        for ext in ('c', 'c++', 'clj', 'cs', 'css', 'dart', 'ex', 'go', 'html',
-                    'java', 'js', 'kt', 'md', 'php', 'py', 'rb', 'rs', 'scala',
-                    'sml', 'swift', 'ts')
-    ]
-    # fmt: on
-
-    syntaxes = []
-    for url in track(urls, transient=True, description="Loading code demos"):
-        # Get the contents of each of the demo files. This is only done once in 3 months
-        response = session.get(url)
-        if response.status_code != 200:
-            continue
-        try:
-            lexer = guess_lexer_for_filename("dracula." + url.split(".")[-1], response.text)
-        except ClassNotFound:
-            continue
-        syntaxes.append(Syntax(response.text, lexer))
-    DraculaDemoApp.run(title="Theme demo", syntaxes=syntaxes)
-
-
-@app.command()
-def download(app: str = typer.Argument(..., help="The name of the app to view")):
-    """
-    Download files for a theme to a specific folder
-
-    This is useful for themes where there is some kind of configuration files required
-    in order to install the theme. Use `.` if the path is the current working directory
-    """
-
-    github_files = []
-    # Render a rich tree for better understanding of the directory structure
-    tree = _render_tree(f"dracula/{app}", github_files)
-    console.print(tree)
-
-    files = questionary.checkbox("Which file(s) do you want to download?", github_files).ask()
-    if not files:
-        raise typer.Exit()
-    # Ask the user for a path to download the files to, this has autocompletion
-    download_path = questionary.path(
-        "Where to download the file to?", only_directories=True, complete_style=CompleteStyle.MULTI_COLUMN
-    ).ask()
-    # The default download path is the current working directory
-    if download_path is None:
-        download_path = "."
-    # Ask for confirmation before downloading the file
-    confirmed = questionary.confirm(f"Are you sure you want to download {files} to {download_path} ")
-    if confirmed:
-        file_urls = [f"https://raw.githubusercontent.com/dracula/{app}/master/{lib}" for lib in files]
-        download_files(file_urls, dest_dir=download_path)
+    # Rich tracebacks need pygments, which is only worth importing when there actually is an exception
+    sys.excepthook = _show_traceback
+    _session_settings.update(token=token, stale_ok=stale_ok, offline=offline, refresh=refresh)
@@ -0,0 +1,3 @@
+"""
+The commands of the cli, each module is only imported when it's command is used
+"""
@@ -0,0 +1,196 @@
+"""
+The `all` command, for viewing all dracula supported apps
+"""
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+import click
+import typer
+
+from .._cli import NOT_APPS, _get_index, _iter_org_repo_pages, console
+from .._index import RepoIndex
+from .._output import get_format, get_record_fields, make_record, write_records
+from .._query import Condition, parse_condition, parse_sort, select
+from .._repo import Repo
+from .._typer import Typer
+from .._utils import TimeFormatter
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
+app = Typer(add_completion=False)
+
+
+@app.command()
+def all(
+    sort: str = typer.Option(
+        "stars",
+        help="What to use when sorting repos, a comma separated list of name,stars,forks,size,watchers,language,issues,created_at,updated_at,pushed_at each optionally prefixed with - for descending or + for ascending order, e.g. -stars,name",
+    ),
+    where: List[str] = typer.Option(
+        [],
+        help="Only show the repos that match a condition, e.g. language=vim, stars>100 or pushed<1y. Can be used multiple times",
+    ),
+    limit: Optional[int] = typer.Option(None, min=1, help="The maximum number of repos to show"),
+    pager: bool = typer.Option(False, help="Whether to use pagination or not"),
+    tui: bool = typer.Option(False, help="Whether to use a textual use interface or not. Close by pressir Ctrl+C or q"),
+    jobs: int = typer.Option(8, min=1, help="How many pages of apps to download at the same time"),
+    stream: bool = typer.Option(
+        False, help="Whether to show the apps page by page as they are downloaded, only when sorting by name"
+    ),
+    graphql: bool = typer.Option(
+        True, help="Whether to use the github GraphQL API when a token is given, it downloads a lot less data"
+    ),
+    output_format: Optional[str] = typer.Option(
+        None,
+        "--format",
+        help="How to show the apps, one of rich, plain, json, ndjson or csv. By default rich in a terminal and plain (tab separated values) otherwise",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        help="A comma separated list of the fields to output with the plain, json, ndjson and csv formats, by default all of name,size,stars,forks,watchers,language,issues,license,created_at,updated_at,pushed_at",
+    ),
+):
+    """
+    View all dracula supported apps
+
+    The output can sometimes be too big to be shown at once in some terminals,
+    to make sure this doesn't happen you can use the --pager flag or if you want the best of the best, use the --tui flag.
+    The --stream flag shows the apps as soon as they are downloaded instead of all at once.
+    The --format option can be used to output the apps as json, ndjson or csv for other programs.
+    The --sort option can be used to sort the list of apps based on specific criterias,
+    the --where option to only show the apps that match some conditions and the --limit option to only show the top apps
+    """
+    if pager and tui:
+        raise click.UsageError("You cannot use both a pager and a tui")
+    if stream and (pager or tui):
+        raise click.UsageError("The apps can only be streamed to the terminal, not to a pager or a tui")
+    # Github can only send the apps in A-Z order, for other orders every app is needed before the first one is shown
+    sorted_by_name = sort.split(",")[0].strip() in ("name", "+name")
+    if stream and not sorted_by_name:
+        raise click.UsageError("The apps can only be streamed when sorting by name, e.g. --sort name")
+    output_format = get_format(output_format, console.is_terminal)
+    if output_format != "rich" and (pager or tui):
+        raise click.UsageError("The pager and the tui can only be used with the rich format")
+    # The options are parsed before anything is downloaded so that mistakes are reported right away
+    conditions = [parse_condition(condition) for condition in where]
+    key = parse_sort(sort)
+    record_fields = get_record_fields(fields)
+
+    if output_format != "rich":
+        # Other programs can start reading the apps as soon as the first page is downloaded if the order allows it
+        if sorted_by_name:
+            pages = _iter_selected_pages(conditions, key, limit, jobs)
+        else:
+            pages = [_get_selected_apps(conditions, key, limit, jobs, graphql)]
+        records = ([make_record(repo, record_fields) for repo in page] for page in pages)
+        write_records(records, output_format, record_fields)
+        return
+    if stream:
+        _stream_apps(conditions, key, limit, jobs)
+        return
+
+    from rich.columns import Columns
+    from rich.rule import Rule
+
+    apps = _get_selected_apps(conditions, key, limit, jobs, graphql)
+    columns = Columns()
+    format_time = TimeFormatter()
+    for repo in apps:
+        columns.add_renderable(_make_panel(repo, format_time))
+    if pager:
+        with console.pager():
+            console.print(Rule(title=f"{len(apps)} Apps"))
+            console.print(columns)
+    elif tui:
+        from .._tui import DraculaColumnsApp
+
+        DraculaColumnsApp.run(title="All Apps", columns=columns)
+    else:
+        console.print(Rule(title=f"{len(apps)} Apps"))
+        console.print(columns)
+
+
+def _get_selected_apps(
+    conditions: List[Condition], key: Callable[[Repo], Tuple], limit: Optional[int], jobs: int, graphql: bool
+) -> List[Repo]:
+    """Get the apps that should be shown in the order they should be shown in"""
+    return select(
+        # If the repo does not exist in draculatheme.com then we don't show it
+        (repo for repo in _get_index(jobs=jobs, graphql=graphql).repos() if repo.name not in NOT_APPS),
+        conditions,
+        key=key,
+        limit=limit,
+    )
+
+
+def _iter_selected_pages(
+    conditions: List[Condition], key: Callable[[Repo], Tuple], limit: Optional[int], jobs: int
+) -> Iterator[List[Repo]]:
+    """Get the apps that should be shown in A-Z order, page by page
+
+    If the index is incomplete the apps are downloaded, and the pages are yielded as soon as they are downloaded so
+    they can be shown one after another. Otherwise all of them are yielded at once from the index
+    """
+    index = RepoIndex()
+    if index.is_complete():
+        yield _get_selected_apps(conditions, key, limit, jobs, graphql=False)
+        return
+    # Anything left from a previous download that was stopped early may not exist anymore
+    index.clear()
+    shown = 0
+    pages = _iter_org_repo_pages("dracula", jobs=jobs, sort="full_name")
+    for _, page in pages:
+        index.update(page)
+        apps = select(
+            (repo for repo in page if repo.name not in NOT_APPS),
+            conditions,
+            key=key,
+            limit=None if limit is None else limit - shown,
+        )
+        yield apps
+        shown += len(apps)
+        if limit is not None and shown >= limit:
+            # The rest of the pages aren't downloaded, so the index stays incomplete
+            pages.close()
+            return
+    index.mark_complete()
+
+
+def _make_panel(repo: Repo, format_time: TimeFormatter) -> "Panel":
+    """Make the panel of an app"""
+    # Rich and the formatting are only imported here since the other output formats don't need them
+    import humanize
+    from rich.panel import Panel
+
+    from .._colors import format_language
+
+    return Panel(
+        (
+            f":pinching_hand: Size: {humanize.naturalsize(repo.size)}\n"
+            f":star: Stars: {repo.stars:,}\n"
+            f":fork_and_knife: Forks: {repo.forks:,}\n"
+            f":eyes: Watchers: {repo.watchers:,}\n"
+            f":abc: Language: {format_language(repo.language)}\n"
+            f":bug: Issues Open: {repo.issues}\n"
+            f":scroll: License: {repo.license or 'Not Specified'}\n"
+            + format_time(repo.created_at, title="Created At", delta_first=False)
+            + format_time(repo.updated_at, title="Last updated")
+            + format_time(repo.pushed_at, title="Last pushed")
+        ),
+        title=f"[link=https://draculatheme.com/{repo.name}]{repo.name}[/]",
+    )
+
+
+def _stream_apps(conditions: List[Condition], key: Callable[[Repo], Tuple], limit: Optional[int], jobs: int) -> None:
+    """Show the apps page by page as soon as each page is downloaded"""
+    from rich.columns import Columns
+    from rich.rule import Rule
+
+    shown = 0
+    format_time = TimeFormatter()
+    with console.status("Loading apps"):
+        for apps in _iter_selected_pages(conditions, key, limit, jobs):
+            if apps:
+                console.print(Columns([_make_panel(repo, format_time) for repo in apps]))
+            shown += len(apps)
+    console.print(Rule(title=f"{shown} Apps"))
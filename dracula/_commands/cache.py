@@ -0,0 +1,160 @@
+"""
+The `cache` commands, for managing the cache used for github requests
+"""
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import click
+import humanize
+import typer
+from rich.panel import Panel
+from rich.progress import Progress
+from requests_cache.models import CachedResponse
+from rich.table import Table
+
+from .._cache import MISSING_STATUS_CODES, group_by_url_pattern, max_cache_size
+from .._cli import (
+    DEMO_URLS,
+    NOT_APPS,
+    _request_github_readme,
+    _request_install_guide,
+    _get_org_repos,
+    _get_org_repos_graphql,
+    console,
+    get_session,
+)
+from .._index import RepoIndex
+from .._typer import Typer
+
+app = Typer(add_completion=False, help="Manage the cache used for github requests")
+
+
+@app.command("warm")
+def cache_warm(
+    jobs: int = typer.Option(8, min=1, help="How many requests to send at the same time"),
+):
+    """
+    Download everything that can be viewed into the cache
+
+    This includes the list of apps, the information, contributors, installation guide and readme of every app, and
+    the demo files. Afterwards every command except download works with the --offline flag. The local index of apps
+    is also downloaded again.
+    """
+    session = get_session()
+    if session.settings.only_if_cached:
+        raise click.UsageError("You cannot warm the cache while offline")
+    # The GraphQL listing is only used with a token, but the REST listing is the fallback so it's always warmed
+    if "Authorization" in session.headers:
+        with console.status("Loading apps"):
+            _get_org_repos_graphql("dracula")
+    repos = _get_org_repos("dracula", jobs=jobs)
+    RepoIndex().replace(repos)
+    apps = [repo.name for repo in repos if repo.name not in NOT_APPS]
+
+    # Pairs of a function and the argument it needs to be called with
+    requests = [(session.get, url) for url in DEMO_URLS]
+    for name in apps:
+        repo = f"dracula/{name}"
+        requests += [
+            (session.get, f"https://api.github.com/repos/{repo}"),
+            (session.get, f"https://api.github.com/repos/{repo}/contributors"),
+            (_request_install_guide, repo),
+            (_request_github_readme, repo),
+        ]
+    with Progress(transient=True) as progress:
+        loading_task = progress.add_task("[#ff5555]Warming cache...", total=len(requests))
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(function, argument) for function, argument in requests]
+            for _ in as_completed(futures):
+                progress.update(loading_task, advance=1)
+    # Missing files are cached like the others, but errors like ratelimits aren't
+    statuses = [None if future.exception() else future.result().status_code for future in futures]
+    failed = sum(status not in (200, *MISSING_STATUS_CODES) for status in statuses)
+    if failed:
+        console.print(f"[#ff5555]{failed} requests failed, run this command again to retry them[/]")
+        if 403 in statuses and "Authorization" not in session.headers:
+            console.print(
+                "[#ff5555]Github only allows 60 requests an hour without a token, use the --token option to get "
+                "more[/]"
+            )
+        raise typer.Exit(1)
+    console.print(f"[#50fa7b]Cached {len(apps)} apps and {len(DEMO_URLS)} demo files[/]")
+
+
+@app.command("stats")
+def cache_stats(
+    oldest: int = typer.Option(5, min=0, help="How many of the oldest cached responses to show"),
+):
+    """
+    View statistics about the cache
+
+    Expired responses are revalidated with github instead of being downloaded again. If the response didn't change
+    then github only sends a small 304 Not Modified response which doesn't count against the ratelimit.
+    """
+    session = get_session()
+    totals = session.statistics.totals()
+    requests = totals["hits"] + totals["misses"] + totals["revalidated"]
+    hit_ratio = (totals["hits"] + totals["revalidated"]) / requests if requests else 0
+    console.print(
+        Panel(
+            f":package: Cache: {session.cache.db_path}\n"
+            f":card_file_box: Size: {humanize.naturalsize(session.least_recently_used.size())}"
+            f" of {humanize.naturalsize(max_cache_size)}\n"
+            f":page_facing_up: Responses: {session.cache.count():,} ({session.cache.count(expired=False):,} not expired)\n"
+            f":direct_hit: Hit ratio: {hit_ratio:.1%} of {requests:,} requests\n"
+            f":arrows_counterclockwise: Revalidated (304 Not Modified): {totals['revalidated']:,}\n"
+            f":floppy_disk: Download saved: {humanize.naturalsize(totals['revalidated_bytes'])}",
+            title="Cache statistics",
+            border_style="#bd93f9",
+            expand=False,
+        )
+    )
+
+    # Responses that can't be read anymore are None, e.g. zstd compressed ones after zstandard was uninstalled
+    responses = [response for response in session.cache.responses.values() if response is not None]
+    table = Table("URL pattern", "Responses", "Size", border_style="#6272a4", header_style="bold #ff79c6")
+    groups = group_by_url_pattern(responses)
+    for pattern, (count, size) in sorted(groups.items(), key=lambda item: item[1][1], reverse=True):
+        table.add_row(pattern, f"{count:,}", humanize.naturalsize(size))
+    console.print(table)
+
+    if oldest:
+        table = Table("Oldest responses", "Cached", "Expires", border_style="#6272a4", header_style="bold #ff79c6")
+        now = dt.datetime.now(dt.timezone.utc)
+        for response in sorted(responses, key=_get_created_at)[:oldest]:
+            table.add_row(
+                response.url,
+                humanize.naturaltime(now - _get_created_at(response)),
+                "Never" if response.expires is None else "Expired" if response.is_expired else "Fresh",
+            )
+        console.print(table)
+
+
+def _get_created_at(response: CachedResponse) -> dt.datetime:
+    """Get when a response was cached, older versions of requests-cache stored the time without a timezone"""
+    created_at = response.created_at
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=dt.timezone.utc)
+
+
+@app.command("prune")
+def cache_prune():
+    """
+    Delete the expired responses from the cache and shrink it
+
+    The least recently used responses are also deleted if the cache is bigger than it's maximum size, which can be
+    set in megabytes with the environment variable DRACULA_CACHE_MAX_SIZE. Keep in mind that expired responses can
+    still be revalidated cheaply and used in offline mode.
+    """
+    session = get_session()
+    before = session.cache.count()
+    size_before = session.least_recently_used.size()
+    with console.status("Pruning cache"):
+        session.least_recently_used.save()
+        session.least_recently_used.evict(max_cache_size)
+        # Vacuuming rebuilds the database file without the free pages left behind by deleted responses
+        session.cache.delete(expired=True, vacuum=True)
+        session.least_recently_used.forget_deleted()
+    console.print(
+        f"[#50fa7b]Deleted {before - session.cache.count():,} responses, "
+        f"freeing {humanize.naturalsize(max(size_before - session.least_recently_used.size(), 0))}[/]"
+    )
@@ -0,0 +1,36 @@
+"""
+The `demo` command, for viewing a demonstration of the theme
+"""
+from pygments.lexers import ClassNotFound, guess_lexer_for_filename
+from rich.progress import track
+from rich.syntax import Syntax
+
+from .._cli import DEMO_URLS, get_session
+from .._tui import DraculaDemoApp
+from .._typer import Typer
+
+app = Typer(add_completion=False)
+
+
+@app.command()
+def demo():
+    """
+    View an approximate demonstration of the dracula theme
+
+    The code shown here is same as the dracula template repo. To switch between different programming languages,
+    use the arrow keys left and right. To scroll you can use the mouse or the up and down arrow keys, the page-up and page-down keys
+    also work. To exit, press q
+    """
+    session = get_session()
+    syntaxes = []
+    for url in track(DEMO_URLS, transient=True, description="Loading code demos"):
+        # Get the contents of each of the demo files. This is only done once in 3 months
+        response = session.get(url)
+        if response.status_code != 200:
+            continue
+        try:
+            lexer = guess_lexer_for_filename("dracula." + url.split(".")[-1], response.text)
+        except ClassNotFound:
+            continue
+        syntaxes.append(Syntax(response.text, lexer))
+    DraculaDemoApp.run(title="Theme demo", syntaxes=syntaxes)
@@ -0,0 +1,45 @@
+"""
+The `download` command, for downloading the files of a theme
+"""
+import questionary
+import typer
+from prompt_toolkit.shortcuts.prompt import CompleteStyle
+
+from .._cli import _get_default_branch, _render_tree, console
+from .._typer import Typer
+
+app = Typer(add_completion=False)
+
+
+@app.command()
+def download(app: str = typer.Argument(..., help="The name of the app to view")):
+    """
+    Download files for a theme to a specific folder
+
+    This is useful for themes where there is some kind of configuration files required
+    in order to install the theme. Use `.` if the path is the current working directory
+    """
+    github_files = []
+    # Render a rich tree for better understanding of the directory structure
+    tree = _render_tree(f"dracula/{app}", github_files)
+    console.print(tree)
+
+    files = questionary.checkbox("Which file(s) do you want to download?", github_files).ask()
+    if not files:
+        raise typer.Exit()
+    # Ask the user for a path to download the files to, this has autocompletion
+    download_path = questionary.path(
+        "Where to download the file to?", only_directories=True, complete_style=CompleteStyle.MULTI_COLUMN
+    ).ask()
+    # The default download path is the current working directory
+    if download_path is None:
+        download_path = "."
+    # Ask for confirmation before downloading the file
+    confirmed = questionary.confirm(f"Are you sure you want to download {files} to {download_path} ")
+    if confirmed:
+        branch = _get_default_branch(f"dracula/{app}")
+        file_urls = [f"https://raw.githubusercontent.com/dracula/{app}/{branch}/{lib}" for lib in files]
+        # The downloader installs a SIGINT handler when it's imported, so it's only imported when it's needed
+        from .._downloader import download_files
+
+        download_files(file_urls, dest_dir=download_path)
@@ -0,0 +1,363 @@
+"""
+The `show` command, for viewing the information and documentation of specific apps
+"""
+import difflib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import typer
+
+from .._cli import (
+    NOT_APPS,
+    _format_error,
+    _generate_contributors_data,
+    _get_github_readme,
+    _get_install_guide,
+    _update_index,
+    console,
+    error_console,
+    get_session,
+)
+from .._index import RepoIndex
+from .._output import get_format, get_record_fields, make_record, write_records
+from .._repo import Repo
+from .._typer import Typer
+from .._utils import TimeFormatter
+
+if TYPE_CHECKING:
+    from requests import Response
+
+app = Typer(add_completion=False)
+
+
+def _complete_app_name(incomplete: str) -> List[str]:
+    """Complete the name of an app from the index, without sending any requests"""
+    return [
+        name
+        for name in RepoIndex().names()
+        if name.lower().startswith(incomplete.lower()) and name not in NOT_APPS
+    ]
+
+
+class _AppFutures(NamedTuple):
+    """The requests of an app that are being sent, the ones that aren't needed are None"""
+
+    repo: "Future[Response]"
+    contributors: Optional["Future[str]"]
+    installation: Optional["Future[Optional[str]]"]
+    readme: Optional["Future[Optional[str]]"]
+
+
+@app.command()
+def show(
+    apps: List[str] = typer.Argument(..., help="The names of the apps to view", autocompletion=_complete_app_name),
+    readme: bool = typer.Option(False, help="Whether to show the github readme page or not"),
+    installation: bool = typer.Option(True, help="Whether to show the installation guide or not"),
+    compact: bool = typer.Option(
+        False, help="Whether to only show a table comparing the apps, without the installation guides and readmes"
+    ),
+    jobs: int = typer.Option(8, min=1, help="How many requests to send at the same time"),
+    output_format: Optional[str] = typer.Option(
+        None,
+        "--format",
+        help="How to show the apps, one of rich, plain, json, ndjson or csv. By default rich in a terminal and plain (tab separated values) otherwise",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        help="A comma separated list of the fields to output with the plain, json, ndjson and csv formats, by default all of name,size,stars,forks,watchers,language,issues,license,created_at,updated_at,pushed_at",
+    ),
+):
+    """
+    View the documentation for the dracula theme for specific apps
+
+    By default only the app git repository metadata and the installation instructions are shown. You can optionally
+    also ask for the readme.md file by using the --readme flag. Multiple apps are shown in the order they were given,
+    or compared in a table with the --compact flag. The --format option can be used to output the apps as json,
+    ndjson or csv for other programs, the installation guide and readme are included as markdown.
+    """
+    output_format = get_format(output_format, console.is_terminal)
+    record_fields = get_record_fields(fields)
+    # The same app given twice is only shown once
+    apps = list(dict.fromkeys(apps))
+    is_rich = output_format == "rich"
+    _check_app_names(apps, is_rich)
+
+    # Only the contributors depend on the repository, and their url can be guessed, so every request of every app is
+    # sent at the same time, and each app is shown as soon as it's data and the apps before it are downloaded
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        fetches = [
+            _fetch_app(
+                pool,
+                app,
+                # The contributors aren't part of the machine readable output
+                contributors=is_rich and not compact,
+                installation=installation and not (is_rich and compact),
+                readme=readme and not (is_rich and compact),
+            )
+            for app in apps
+        ]
+        failed_apps = []
+
+        def get_repos() -> Iterator[Tuple[Repo, _AppFutures]]:
+            # The apps are waited for in order, the ones that failed are skipped after their error is shown
+            for app, futures in zip(apps, fetches):
+                repo = _get_repo(app, futures, is_rich)
+                if repo is None:
+                    failed_apps.append(app)
+                else:
+                    yield repo, futures
+
+        if not is_rich:
+            documents = [name for name, enabled in (("installation", installation), ("readme", readme)) if enabled]
+            _write_apps(get_repos(), output_format, record_fields, documents)
+        elif compact:
+            _show_table([repo for repo, _ in get_repos()])
+        else:
+            for repo, futures in get_repos():
+                if len(apps) > 1:
+                    from rich.rule import Rule
+
+                    console.print(Rule(title=f"[#50fa7b]{repo.name}[/]"))
+                _show_app(repo, futures.contributors, futures.installation, futures.readme)
+    if failed_apps:
+        # Programs reading the output need to know that it's incomplete
+        raise typer.Exit(1)
+
+
+def _fetch_app(pool: ThreadPoolExecutor, app: str, contributors: bool, installation: bool, readme: bool) -> _AppFutures:
+    """Start sending the requests of an app"""
+    session = get_session()
+    url = f"https://api.github.com/repos/dracula/{app}"
+    repo_future = pool.submit(session.get, url)
+
+    def get_install_guide() -> Optional[str]:
+        # The raw url needs the default branch, which is only waited for if the app isn't in the index. The
+        # repository request was submitted before this, so it's already running and this can't wait on a queued
+        # request when every thread of the pool is busy
+        indexed_repo = RepoIndex().get(app)
+        if indexed_repo is not None and indexed_repo.default_branch:
+            return _get_install_guide(f"dracula/{app}", indexed_repo.default_branch)
+        response = repo_future.result()
+        if response.status_code != 200:
+            return None
+        return _get_install_guide(f"dracula/{app}", response.json().get("default_branch"))
+
+    return _AppFutures(
+        repo=repo_future,
+        contributors=pool.submit(_generate_contributors_data, f"{url}/contributors") if contributors else None,
+        installation=pool.submit(get_install_guide) if installation else None,
+        readme=pool.submit(_get_github_readme, f"dracula/{app}") if readme else None,
+    )
+
+
+def _get_repo(app: str, futures: _AppFutures, is_rich: bool) -> Optional[Repo]:
+    """Wait for the repository of an app, the error is shown and the other requests are cancelled if it failed"""
+    response = futures.repo.result()
+    if response.status_code == 200:
+        return Repo.from_rest(response.json())
+
+    from rich.panel import Panel
+
+    for future in futures[1:]:
+        if future is not None:
+            future.cancel()
+    # Errors can't be mixed with machine readable output
+    (console if is_rich else error_console).print(
+        Panel(
+            _format_error(response),
+            title=f"Could not get [#50fa7b]{app}[/]",
+            border_style="#ff5555",
+            title_align="left",
+        )
+    )
+    return None
+
+
+def _show_table(repos: List[Repo]) -> None:
+    """Show a table comparing apps"""
+    from datetime import datetime
+
+    import humanize
+    from rich.table import Table
+
+    from .._colors import format_language
+
+    now = datetime.utcnow()
+    table = Table(
+        "App",
+        "Stars",
+        "Forks",
+        "Watchers",
+        "Issues",
+        "Language",
+        "License",
+        "Size",
+        "Last pushed",
+        border_style="#6272a4",
+        header_style="bold #ff79c6",
+    )
+    for repo in repos:
+        table.add_row(
+            f"[link=https://draculatheme.com/{repo.name}]{repo.name}[/]",
+            f"{repo.stars:,}",
+            f"{repo.forks:,}",
+            f"{repo.watchers:,}",
+            f"{repo.issues:,}",
+            format_language(repo.language),
+            repo.license or "Not Specified",
+            humanize.naturalsize(repo.size),
+            humanize.naturaltime(now - repo.pushed_at) if repo.pushed_at else "Never",
+        )
+    console.print(table)
+
+
+def _show_app(
+    repo: Repo,
+    contributors_future: "Future[str]",
+    installation_future: Optional["Future[Optional[str]]"],
+    readme_future: Optional["Future[Optional[str]]"],
+) -> None:
+    """Show an app while the rest of it's data is being downloaded"""
+    import humanize
+    from rich.align import Align
+    from rich.box import HEAVY_EDGE
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from .._colors import format_language
+
+    format_time = TimeFormatter()
+
+    with console.status("Getting contributors"):
+        contributors = contributors_future.result()
+    console.print(
+        Align(
+            Panel(
+                (
+                    f":pinching_hand: Size: {humanize.naturalsize(repo.size)}\n"
+                    f":star: Stars: {repo.stars:,}\n"
+                    f":fork_and_knife: Forks: {repo.forks:,}\n"
+                    f":eyes: Watchers: {repo.watchers:,}\n"
+                    f":abc: Language: {format_language(repo.language)}\n"
+                    f":bug: Issues Open: {repo.issues}\n"
+                    f":scroll: License: {repo.license or 'Not Specified'}\n"
+                    + format_time(repo.created_at, title="Created At", delta_first=False)
+                    + format_time(repo.updated_at, title="Last updated")
+                    + format_time(repo.pushed_at, title="Last pushed")
+                    + contributors
+                ),
+                title=(repo.description or "").replace("🧛🏻‍♂️", ":vampire:"),
+                border_style="#8be9fd",
+                expand=False,
+                subtitle=f"https://draculatheme.com/{repo.name}",
+            ),
+            "center",
+        )
+    )
+    # console.print(Rule(title="Installation Guide", characters="━"))
+    if installation_future is not None:
+        with console.status("Getting installation guide"):
+            installation_guide = installation_future.result()
+        console.print(
+            Panel(
+                # Missing guides are cached, so they are a normal case and not an error
+                Markdown(installation_guide, code_theme="dracula")
+                if installation_guide is not None
+                else Align("[i]This app has no installation guide[/]", "center"),
+                title="[b u]Installation Guide[/]",
+                border_style="#50fa7b",
+                box=HEAVY_EDGE,
+            )
+        )
+    if readme_future is not None:
+        with console.status("Getting github readme"):
+            github_readme = readme_future.result()
+        console.print(
+            Panel(
+                Markdown(github_readme, code_theme="dracula")
+                if github_readme is not None
+                else Align("[i]This app has no readme[/]", "center"),
+                title="[b u]Readme[/]",
+                border_style="#ff79c6",
+                box=HEAVY_EDGE,
+            )
+        )
+    # If both readme and installation are false then there's nothing to show for detailed information.
+    # This may not be intentional, so it just informs the user
+    if installation_future is None and readme_future is None:
+        console.print(Align("[bold #ff5555]You disabled both installation and readme.[/]", "center"))
+
+
+def _write_apps(
+    apps: Iterable[Tuple[Repo, _AppFutures]], output_format: str, fields: List[str], documents: List[str]
+) -> None:
+    """Write apps in a machine readable format, each one as soon as it's downloaded
+
+    Parameters
+    ----------
+    apps : Iterable[Tuple[Repo, _AppFutures]]
+        The repositories of the apps and their requests
+    output_format : str
+        One of plain, json, ndjson or csv
+    fields : List[str]
+        The fields of the repositories to write
+    documents : List[str]
+        The documents that are included as markdown, installation and/or readme
+    """
+    if output_format == "plain":
+        # Tab separated values can't have multiple lines, so the markdown is written as is after the fields
+        for repo, futures in apps:
+            write_records([[make_record(repo, fields)]], output_format, fields)
+            for document in filter(None, _get_documents(futures).values()):
+                print(f"\n{document}")
+        return
+    pages = ([{**make_record(repo, fields), **_get_documents(futures)}] for repo, futures in apps)
+    write_records(pages, output_format, [*fields, *documents])
+
+
+def _get_documents(futures: _AppFutures) -> Dict[str, Optional[str]]:
+    """Wait for the installation guide and readme of an app, if they were requested"""
+    documents = {}
+    if futures.installation is not None:
+        documents["installation"] = futures.installation.result()
+    if futures.readme is not None:
+        documents["readme"] = futures.readme.result()
+    return documents
+
+
+def _check_app_names(apps: List[str], is_rich: bool) -> None:
+    """Make sure that apps exist using the index, so that misspelled names don't need a request to github"""
+    index = RepoIndex()
+    if not index.is_complete():
+        # The apps may be missing from an incomplete index, so github is asked instead
+        return
+    names = index.names()
+    if all(app.lower() in map(str.lower, names) for app in apps):
+        return
+    # The apps may have been created since the index was refreshed
+    _update_index(index)
+    names = index.names()
+    lowercase_names = set(map(str.lower, names))
+    unknown_apps = [app for app in apps if app.lower() not in lowercase_names]
+    if not unknown_apps:
+        return
+
+    from rich.panel import Panel
+
+    for app in unknown_apps:
+        suggestions = difflib.get_close_matches(app, names, n=3, cutoff=0.6)
+        # Errors can't be mixed with machine readable output
+        (console if is_rich else error_console).print(
+            Panel(
+                f"There is no app named {app}"
+                + (
+                    f", did you mean {' or '.join(f'[#50fa7b]{name}[/]' for name in suggestions)}?"
+                    if suggestions
+                    else ""
+                ),
+                title=f"Could not get [#50fa7b]{app}[/]",
+                border_style="#ff5555",
+                title_align="left",
+            )
+        )
+    raise typer.Exit(1)
@@ -0,0 +1,42 @@
+"""
+Loading of the configuration file, and the directories used by the cli
+"""
+import json
+import os
+import os.path
+from typing import Any, Dict
+
+import click
+from platformdirs import user_cache_dir
+
+# e.g. ~/.config/dracula-cli/config.json on linux
+config_path = os.environ.get("DRACULA_CONFIG", os.path.join(click.get_app_dir("dracula-cli"), "config.json"))
+# e.g. ~/.cache/dracula-cli on linux. The install directory can't be used since it's read-only for system and pipx
+# installs, and it's shared between every user
+cache_dir = os.environ.get("DRACULA_CACHE_DIR") or user_cache_dir("dracula-cli")
+
+
+def load_config() -> Dict[str, Any]:
+    """Load the configuration file which is used for the default values of the command line options
+
+    The keys are the option names of the `dracula` command, and the options of a specific command can be set in an
+    object with the name of that command. e.g. {"stale_ok": true, "all": {"sort": "name"}}
+
+    Returns
+    -------
+    Dict[str, Any]
+        The configuration, this is empty if there is no configuration file
+    """
+    try:
+        with open(config_path, encoding="utf-8") as file:
+            config = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except ValueError as error:
+        # A broken configuration file shouldn't make the whole cli unusable
+        click.secho(f"Ignoring invalid configuration file {config_path}: {error}", fg="red", err=True)
+        return {}
+    if not isinstance(config, dict):
+        click.secho(f"Ignoring configuration file {config_path}: it is not a JSON object", fg="red", err=True)
+        return {}
+    return config
@@ -0,0 +1,129 @@
+"""
+A local index of the dracula repositories
+
+The index keeps the fields that are shown for every repository in a sqlite database next to the cache, so listing
+the apps doesn't need the whole organization listing from github every time. It's refreshed by `_cli._get_index`
+"""
+import os
+import os.path
+import sqlite3
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from ._config import cache_dir
+from ._repo import Repo
+
+# e.g. ~/.cache/dracula-cli/index.sqlite on linux
+index_path = os.path.join(cache_dir, "index.sqlite")
+
+# Repositories that were deleted or renamed can't be noticed by an incremental refresh, so the whole index is
+# downloaded again when the last full refresh is older than this, in seconds
+FULL_REFRESH_INTERVAL = 7 * 86_400
+
+# This needs to be increased when the fields of `Repo` or their meaning change, old indexes are then deleted
+SCHEMA_VERSION = 3
+
+_DATE_FIELDS = ("created_at", "updated_at", "pushed_at")
+
+
+class RepoIndex:
+    """The index of the repositories of the dracula organization
+
+    Parameters
+    ----------
+    path : str, optional
+        The path of the database, by default `index_path`
+    """
+
+    def __init__(self, path: str = index_path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Multiple dracula processes can use the index at the same time, like the cache
+        self._connection = sqlite3.connect(path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            # The index only has data from github, so it can just be downloaded again instead of being migrated
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS repos")
+                self._connection.execute("DROP TABLE IF EXISTS metadata")
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS repos ({', '.join(Repo._fields)}, PRIMARY KEY (name))"
+            )
+            self._connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value)")
+
+    def is_complete(self) -> bool:
+        """Whether the index has every repository, i.e. it was fully refreshed recently enough"""
+        refreshed_at = self._get_metadata("refreshed_at")
+        return refreshed_at is not None and time.time() - refreshed_at < FULL_REFRESH_INTERVAL
+
+    def repos(self) -> List[Repo]:
+        """Get every repository in the index"""
+        rows = self._connection.execute(f"SELECT {', '.join(Repo._fields)} FROM repos")
+        return [_from_row(row) for row in rows]
+
+    def get(self, name: str) -> Optional[Repo]:
+        """Get a repository from the index by it's name, which is case insensitive like on github"""
+        row = self._connection.execute(
+            f"SELECT {', '.join(Repo._fields)} FROM repos WHERE name = ? COLLATE NOCASE", (name,)
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def names(self) -> List[str]:
+        """Get the names of every repository in the index"""
+        return [row[0] for row in self._connection.execute("SELECT name FROM repos ORDER BY name COLLATE NOCASE")]
+
+    def latest(self, field: str) -> Optional[datetime]:
+        """Get the latest value of a date field, used to know where an incremental refresh can stop"""
+        if field not in _DATE_FIELDS:
+            raise ValueError(f"{field} is not a date field")
+        (value,) = self._connection.execute(f"SELECT max({field}) FROM repos").fetchone()
+        return datetime.fromisoformat(value) if value else None
+
+    def update(self, repos: Iterable[Repo]) -> None:
+        """Add repositories to the index, or update them if they are already in it"""
+        with self._connection:
+            self._insert(repos)
+
+    def clear(self) -> None:
+        """Delete every repository from the index"""
+        with self._connection:
+            self._connection.execute("DELETE FROM repos")
+            self._connection.execute("DELETE FROM metadata WHERE key = 'refreshed_at'")
+
+    def mark_complete(self) -> None:
+        """Mark the index as having every repository, after a full refresh"""
+        with self._connection:
+            self._mark_complete()
+
+    def replace(self, repos: Iterable[Repo]) -> None:
+        """Replace every repository in the index, for a full refresh"""
+        # Everything is done in one transaction so that other processes never see a half empty index
+        with self._connection:
+            self._connection.execute("DELETE FROM repos")
+            self._insert(repos)
+            self._mark_complete()
+
+    def _insert(self, repos: Iterable[Repo]) -> None:
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO repos VALUES ({', '.join('?' * len(Repo._fields))})", map(_to_row, repos)
+        )
+
+    def _mark_complete(self) -> None:
+        self._connection.execute("INSERT OR REPLACE INTO metadata VALUES ('refreshed_at', ?)", (time.time(),))
+
+    def _get_metadata(self, key: str):
+        row = self._connection.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+
+def _to_row(repo: Repo) -> tuple:
+    # Dates are stored as ISO 8601 text, which sorts the same way as the dates themselves
+    return tuple(value.isoformat() if isinstance(value, datetime) else value for value in repo)
+
+
+def _from_row(row: tuple) -> Repo:
+    repo = Repo(*row)
+    return repo._replace(
+        **{field: datetime.fromisoformat(getattr(repo, field)) for field in _DATE_FIELDS if getattr(repo, field)}
+    )
@@ -0,0 +1,135 @@
+"""
+Machine readable output of repositories
+
+Nothing here uses rich, since the output is meant for other programs and rendering it with rich would be a waste
+"""
+import csv
+import json
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+import typer
+
+from ._query import FIELDS
+from ._repo import Repo
+
+# The formats that can be given to --format, "rich" is the normal output
+FORMATS = ("rich", "plain", "json", "ndjson", "csv")
+
+# The fields that are written by default
+DEFAULT_FIELDS = [field for field in Repo._fields if field not in ("description", "default_branch")]
+
+
+def get_format(output_format: Optional[str], is_terminal: bool) -> str:
+    """Get the output format to use
+
+    Parameters
+    ----------
+    output_format : Optional[str]
+        The format given to --format
+    is_terminal : bool
+        Whether the output is shown in a terminal
+
+    Returns
+    -------
+    str
+        The format, by default rich in a terminal and plain text when the output is piped to another program
+    """
+    if output_format is None:
+        return "rich" if is_terminal else "plain"
+    output_format = output_format.lower()
+    if output_format not in FORMATS:
+        raise typer.BadParameter(
+            f"Unknown format {output_format!r}, valid formats are {', '.join(FORMATS)}", param_hint="--format"
+        )
+    return output_format
+
+
+def get_record_fields(fields: Optional[str]) -> List[str]:
+    """Parse a --fields value
+
+    Parameters
+    ----------
+    fields : Optional[str]
+        A comma separated list of field names, the names used by --sort can also be used
+
+    Returns
+    -------
+    List[str]
+        The fields of the repositories used in the output, every field except the description and default branch
+        if none were given
+
+    Raises
+    ------
+    typer.BadParameter
+        If one of the fields does not exist
+    """
+    if not fields:
+        return DEFAULT_FIELDS
+    record_fields = []
+    for name in filter(None, map(str.strip, fields.split(","))):
+        name = name.lower()
+        record_field = name if name in Repo._fields else FIELDS.get(name)
+        if record_field is None:
+            raise typer.BadParameter(
+                f"Unknown field {name!r}, valid fields are {', '.join(Repo._fields)}", param_hint="--fields"
+            )
+        record_fields.append(record_field)
+    return record_fields
+
+
+def make_record(repo: Repo, fields: List[str]) -> Dict[str, Any]:
+    """Get the fields of a repository that are in the output"""
+    record = {}
+    for field in fields:
+        value = getattr(repo, field)
+        # Times are written the same way github sends them
+        record[field] = value.strftime("%Y-%m-%dT%H:%M:%SZ") if isinstance(value, datetime) else value
+    return record
+
+
+def write_records(
+    pages: Iterable[Iterable[Dict[str, Any]]], output_format: str, fields: List[str], file: Optional[TextIO] = None
+) -> None:
+    """Write records as soon as they are available
+
+    Parameters
+    ----------
+    pages : Iterable[Iterable[Dict[str, Any]]]
+        The records in pages, the output is flushed after every page so other programs can start reading it before
+        the next page is available
+    output_format : str
+        One of plain (tab separated values without a header), json, ndjson (a json object on each line) or csv
+    fields : List[str]
+        The fields of the records, used for the csv header
+    file : Optional[TextIO], optional
+        Where to write the records to, by default stdout
+    """
+    file = file or sys.stdout
+    if output_format == "json":
+        # The array is written piece by piece so that the records don't need to be all in memory at once
+        file.write("[")
+        separator = "\n"
+        for page in pages:
+            for record in page:
+                file.write(separator + json.dumps(record, ensure_ascii=False))
+                separator = ",\n"
+            file.flush()
+        file.write("\n]\n" if separator != "\n" else "]\n")
+    elif output_format == "ndjson":
+        for page in pages:
+            for record in page:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+    elif output_format == "csv":
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for page in pages:
+            writer.writerows(page)
+            file.flush()
+    else:
+        for page in pages:
+            for record in page:
+                file.write("\t".join("" if value is None else str(value) for value in record.values()) + "\n")
+            file.flush()
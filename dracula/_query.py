@@ -0,0 +1,260 @@
+"""
+Filtering and sorting of the repositories shown by the `all` command
+"""
+import heapq
+import re
+from operator import attrgetter
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import typer
+
+from ._colors import get_language_index, normalize_language
+from ._repo import Repo
+
+Condition = Callable[[Repo], bool]
+
+# Mapping of the names that can be used in --where and --sort to the fields of the repositories
+FIELDS = {
+    "name": "name",
+    "stars": "stars",
+    "star": "stars",
+    "forks": "forks",
+    "fork": "forks",
+    "watchers": "watchers",
+    "watcher": "watchers",
+    "size": "size",
+    "language": "language",
+    "issues": "issues",
+    "issue": "issues",
+    "created": "created_at",
+    "updated": "updated_at",
+    "pushed": "pushed_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "pushed_at": "pushed_at",
+    # The names used by the github api
+    "stargazers_count": "stars",
+    "forks_count": "forks",
+    "watchers_count": "watchers",
+    "open_issues": "issues",
+    "open_issues_count": "issues",
+}
+TEXT_FIELDS = {"name", "language"}
+DATE_FIELDS = {"created_at", "updated_at", "pushed_at"}
+
+_condition_pattern = re.compile(r"^\s*(\w+)\s*(<=|>=|!=|==|=|<|>)\s*(.*?)\s*$")
+_age_pattern = re.compile(r"^(\d+(?:\.\d+)?)\s*(h|d|w|mo|y)$", re.IGNORECASE)
+_age_units = {
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "mo": timedelta(days=30),
+    "y": timedelta(days=365),
+}
+_operators: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+# The operator to use on a date when the operator was used on an age, e.g. pushed<1y means pushed after a year ago
+_inverted_operators = {"=": "=", "==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+def get_field(name: str, option: str) -> str:
+    """Get the field of the repositories with a name given by the user
+
+    Parameters
+    ----------
+    name : str
+        The field name, e.g. stars
+    option : str
+        The option the name was given to, used for the error message
+
+    Returns
+    -------
+    str
+        The field, e.g. stars
+
+    Raises
+    ------
+    typer.BadParameter
+        If the field does not exist
+    """
+    try:
+        return FIELDS[name.lower()]
+    except KeyError:
+        raise typer.BadParameter(
+            f"Unknown field {name!r}, valid fields are {', '.join(sorted(FIELDS))}", param_hint=option
+        ) from None
+
+
+def _normalize_text(field: str, text: str) -> str:
+    """Normalize a text value so that it's compared case insensitively, languages are also matched by their aliases"""
+    if field == "language":
+        language = get_language_index().get(normalize_language(text))
+        if language:
+            return language.name.casefold()
+    return text.casefold()
+
+
+def parse_condition(expression: str, now: Optional[datetime] = None) -> Condition:
+    """Parse a --where condition
+
+    Conditions are a field, an operator (=, !=, <, <=, > or >=) and a value, e.g. language=vim, stars>100 or
+    pushed<1y. Names and languages are compared case insensitively. Dates can be compared with a date (or the start
+    of one, e.g. created=2019) or with an age in hours, days, weeks, months or years (h, d, w, mo or y)
+
+    Parameters
+    ----------
+    expression : str
+        The condition
+    now : Optional[datetime], optional
+        The current time in UTC that ages are relative to, by default the current time
+
+    Returns
+    -------
+    Condition
+        A function that checks whether a repository matches the condition
+
+    Raises
+    ------
+    typer.BadParameter
+        If the condition is invalid
+    """
+    match = _condition_pattern.match(expression)
+    if match is None:
+        raise typer.BadParameter(f"Invalid condition {expression!r}, e.g. stars>100", param_hint="--where")
+    name, operator, value = match.groups()
+    field = get_field(name, "--where")
+    compare = _operators[operator]
+
+    get = attrgetter(field)
+
+    if field in DATE_FIELDS:
+        age = _age_pattern.match(value)
+        if age:
+            amount, unit = age.groups()
+            compare = _operators[_inverted_operators[operator]]
+            value = (now or datetime.utcnow()) - float(amount) * _age_units[unit.lower()]
+        elif operator in ("=", "==", "!="):
+            # A date also matches every time in that date, e.g. created=2019 matches every repository created in 2019
+            value = value.rstrip("Z")
+            _parse_date(value)
+            matches = operator != "!="
+            # Repositories without a value only match !=
+            return lambda repo: get(repo).isoformat().startswith(value) == matches if get(repo) else not matches
+        else:
+            value = _parse_date(value)
+    elif field in TEXT_FIELDS:
+        text = _normalize_text(field, value)
+        return lambda repo: compare(_normalize_text(field, get(repo) or ""), text)
+    else:
+        try:
+            value = float(value)
+        except ValueError:
+            raise typer.BadParameter(f"{name} needs to be compared to a number", param_hint="--where") from None
+
+    # Repositories without a value only match !=
+    return lambda repo: compare(get(repo), value) if get(repo) is not None else operator == "!="
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a date given in a --where condition, e.g. 2019, 2019-03 or 2019-03-01"""
+    try:
+        if len(value) == 4:
+            return datetime(int(value), 1, 1)
+        if len(value) == 7:
+            return datetime(int(value[:4]), int(value[5:]), 1)
+        return datetime.fromisoformat(value.rstrip("Z"))
+    except ValueError:
+        raise typer.BadParameter(
+            f"Invalid date {value!r}, use a date like 2019-03-01 or an age like 1y", param_hint="--where"
+        ) from None
+
+
+class _Reversed:
+    """Reverses the order of a value that can't be negated, for sorting strings and dates in descending order"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: "_Reversed") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+
+def parse_sort(sort: str) -> Callable[[Repo], Tuple]:
+    """Parse a --sort value
+
+    The value is a comma separated list of fields, each optionally prefixed with - for descending or + for ascending
+    order. Without a prefix names and languages are sorted A-Z, and everything else from highest or latest to lowest
+    or earliest since that's what people usually want
+
+    Parameters
+    ----------
+    sort : str
+        The value, e.g. -stars,name
+
+    Returns
+    -------
+    Callable[[Repo], Tuple]
+        The sorting key of a repository, repositories without a value for a field are sorted last
+    """
+    keys: List[Tuple[str, bool]] = []
+    for name in filter(None, map(str.strip, sort.split(","))):
+        field = get_field(name.lstrip("+-"), "--sort")
+        keys.append((field, name.startswith("-") or (name[0] != "+" and field not in TEXT_FIELDS)))
+
+    def key(repo: Repo) -> Tuple:
+        values = []
+        for field, descending in keys:
+            value = getattr(repo, field)
+            if value is None:
+                values.append((True, None))
+            elif isinstance(value, int):
+                values.append((False, -value if descending else value))
+            else:
+                if isinstance(value, str):
+                    value = _normalize_text(field, value)
+                values.append((False, _Reversed(value) if descending else value))
+        return tuple(values)
+
+    return key
+
+
+def select(
+    repos: Iterable[Repo], conditions: List[Condition], key: Callable[[Repo], Tuple], limit: Optional[int] = None
+) -> List[Repo]:
+    """Filter and sort repositories
+
+    Parameters
+    ----------
+    repos : Iterable[Repo]
+        The repositories
+    conditions : List[Condition]
+        The conditions that the repositories need to match
+    key : Callable[[Repo], Tuple]
+        The sorting key
+    limit : Optional[int], optional
+        The maximum number of repositories to return, by default all of them
+
+    Returns
+    -------
+    List[Repo]
+        The repositories that match every condition sorted by the key
+    """
+    # The repositories are filtered first so that the sorting keys are only calculated for the ones that are shown
+    matches = (repo for repo in repos if all(condition(repo) for condition in conditions))
+    if limit is not None:
+        # Only the top repositories are kept in a heap instead of sorting all of them
+        return heapq.nsmallest(limit, matches, key=key)
+    return sorted(matches, key=key)
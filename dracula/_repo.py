@@ -0,0 +1,87 @@
+"""
+Compact records of the github repositories shown by the cli
+
+The REST API sends about 80 keys for every repository, so the responses are converted to these records right away
+instead of keeping them around
+"""
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+
+def parse_github_time(iso_8601_time: Optional[str]) -> Optional[datetime]:
+    """Parse a time sent by github, e.g. 2022-01-01T00:00:00Z
+
+    Parameters
+    ----------
+    iso_8601_time : Optional[str]
+        The time in UTC
+
+    Returns
+    -------
+    Optional[datetime]
+        The time as a naive datetime in UTC, None if there is no time
+    """
+    if not iso_8601_time:
+        return None
+    # fromisoformat doesn't support the Z suffix before python 3.11
+    return datetime.fromisoformat(iso_8601_time.rstrip("Z"))
+
+
+class Repo(NamedTuple):
+    """The fields of a repository that are shown"""
+
+    name: str
+    description: Optional[str]
+    size: int
+    stars: int
+    forks: int
+    watchers: int
+    language: Optional[str]
+    issues: int
+    license: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    pushed_at: Optional[datetime]
+    # Needed for the raw urls of the files in the repository
+    default_branch: Optional[str]
+
+    @classmethod
+    def from_rest(cls, data: Dict[str, Any]) -> "Repo":
+        """Make a record from a repository sent by the REST API"""
+        return cls(
+            name=data["name"],
+            description=data.get("description"),
+            size=data.get("size") or 0,
+            stars=data.get("stargazers_count") or 0,
+            forks=data.get("forks_count") or 0,
+            watchers=data.get("watchers_count") or 0,
+            language=data.get("language"),
+            # The REST API counts open pull requests as issues too
+            issues=data.get("open_issues_count") or 0,
+            license=data["license"]["name"] if data.get("license") else None,
+            created_at=parse_github_time(data.get("created_at")),
+            updated_at=parse_github_time(data.get("updated_at")),
+            pushed_at=parse_github_time(data.get("pushed_at")),
+            default_branch=data.get("default_branch"),
+        )
+
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> "Repo":
+        """Make a record from a repository sent by the GraphQL API, see `_cli._ORG_REPOS_QUERY`"""
+        return cls(
+            name=node["name"],
+            description=node.get("description"),
+            size=node["diskUsage"] or 0,
+            stars=node["stargazerCount"],
+            forks=node["forkCount"],
+            # The REST API's watchers_count is the amount of stargazers, not of the people watching the repository
+            watchers=node["stargazerCount"],
+            language=node["primaryLanguage"]["name"] if node["primaryLanguage"] else None,
+            # Issues are counted the same way as the REST API
+            issues=node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+            license=node["licenseInfo"]["name"] if node["licenseInfo"] else None,
+            created_at=parse_github_time(node["createdAt"]),
+            updated_at=parse_github_time(node["updatedAt"]),
+            pushed_at=parse_github_time(node["pushedAt"]),
+            default_branch=node["defaultBranchRef"]["name"] if node.get("defaultBranchRef") else None,
+        )
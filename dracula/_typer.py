@@ -2,23 +2,77 @@
 Custom typer subclass for rich help command formatting
 """
 
-from typing import Callable
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
 
+import click
 from rich_click import RichCommand, RichGroup
 from typer import Typer as BaseTyper
 from typer import *  # noqa
+from typer.main import get_command
 from typer.models import CommandFunctionType
 
 
+class LazyRichGroup(RichGroup):
+    """A rich group that only imports the modules of it's lazy commands when they are used
+
+    The lazy commands are given as a mapping of the command name to the import path of the command's typer app or
+    click command (e.g. "dracula._commands.show:app") and it's short help. The short help is used for listing the
+    commands so that `--help` doesn't need to import any of them.
+    """
+
+    lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaded_commands: Dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        if cmd_name in self._loaded_commands:
+            return self._loaded_commands[cmd_name]
+        # A placeholder that is only good for listing the command with it's short help
+        return click.Command(cmd_name, short_help=self.lazy_commands[cmd_name][1])
+
+    def resolve_command(self, ctx: click.Context, args: List[str]):
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        # The command is being run or it's full help is being shown, so it needs to be imported now
+        if cmd_name in self.lazy_commands and cmd_name not in self._loaded_commands:
+            command = self._loaded_commands[cmd_name] = self._load_command(cmd_name)
+        return cmd_name, command, args
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy command"""
+        import_path, short_help = self.lazy_commands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(command, BaseTyper):
+            command = get_command(command)
+        command.name = cmd_name
+        command.short_help = command.short_help or short_help
+        return command
+
+
 class Typer(BaseTyper):
-    """A custom subclassed version of typer.Typer to allow rich help"""
+    """A custom subclassed version of typer.Typer to allow rich help
+
+    Commands that are defined in other modules can be given with lazy_commands, see :class:`LazyRichGroup`
+    """
 
     def __init__(
         self,
         *args,
         cls=RichGroup,
+        lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None,
         **kwargs,
     ) -> None:
+        if lazy_commands:
+            cls = type(cls.__name__, (LazyRichGroup, cls), {"lazy_commands": lazy_commands})
         super().__init__(*args, cls=cls, **kwargs)
 
     def command(
@@ -2,27 +2,17 @@
 Utility functions
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 import time
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Optional, Sequence, TypeVar
 
 
-def ceil_dt(dt: datetime, delta: timedelta = timedelta(minutes=30)) -> datetime:
-    """Ceils a datetime to the nearest timedelta
-
-    Parameters
-    ----------
-    dt : datetime
-        The datetime to ceil
-    delta : timedelta, optional
-        The timedelta to ceil to, by default timedelta(minutes=30)
-
-    Returns
-    -------
-    datetime
-        The ceiled datetime
-    """
-    # TODO: instead of ceil_dt, round_dt should be used
-    return dt + (datetime.min - dt) % delta
+# The clock emojis for every half hour of a day, the `* 2` is there to make it 12 hour time instead of 24 hour time
+CLOCK_EMOJIS = (
+    "🕛", "🕧", "🕐", "🕜", "🕑", "🕝", "🕒", "🕞", "🕓", "🕟", "🕔", "🕠",
+    "🕕", "🕡", "🕖", "🕢", "🕗", "🕣", "🕘", "🕤", "🕙", "🕥", "🕚", "🕦",
+) * 2  # fmt: skip
+HALF_HOUR = 30 * 60 * 10**6  # In microseconds
 
 
 def get_closest_clock_emoji(datetime: datetime) -> str:
@@ -38,52 +28,63 @@ def get_closest_clock_emoji(datetime: datetime) -> str:
     str
         The clock emoji that was gotten
     """
-    emojis = {
-        "1:00": "🕐",
-        "1:30": "🕜",
-        "2:00": "🕑",
-        "2:30": "🕝",
-        "3:00": "🕒",
-        "3:30": "🕞",
-        "4:00": "🕓",
-        "4:30": "🕟",
-        "5:00": "🕔",
-        "5:30": "🕠",
-        "6:00": "🕕",
-        "6:30": "🕡",
-        "7:00": "🕖",
-        "7:30": "🕢",
-        "8:00": "🕗",
-        "8:30": "🕣",
-        "9:00": "🕘",
-        "9:30": "🕤",
-        "10:00": "🕙",
-        "10:30": "🕥",
-        "11:00": "🕚",
-        "11:30": "🕦",
-        "0:00": "🕛",
-        "0:30": "🕧",
-    }
-    # The `% 12` is there to make it 12 hour time instead of 24 hour time
-    return emojis[f"{ceil_dt(datetime).hour % 12}:{ceil_dt(datetime).minute:02}"]
-
-
-def datetime_from_utc_to_local(utc_datetime: datetime) -> datetime:
-    """Converts a utc time to local time
+    microseconds = ((datetime.hour * 60 + datetime.minute) * 60 + datetime.second) * 10**6 + datetime.microsecond
+    # The time is rounded up to the next half hour, the `% 48` wraps 24:00 around to 0:00
+    return CLOCK_EMOJIS[-(-microseconds // HALF_HOUR) % 48]
 
-    Parameters
-    ----------
-    utc_datetime : datetime
-        The time in UTC
 
-    Returns
-    -------
-    datetime
-        The local time equivalent
+class TimeFormatter:
+    """Formats the times shown for repositories
+
+    The current time and the utc offset are only calculated once when this is created, so one formatter should be
+    used for all the repositories that are shown at the same time
     """
-    now_timestamp = time.time()
-    offset = datetime.fromtimestamp(now_timestamp) - datetime.utcfromtimestamp(now_timestamp)
-    return utc_datetime + offset
+
+    def __init__(self, now: Optional[datetime] = None) -> None:
+        """
+        Parameters
+        ----------
+        now : Optional[datetime], optional
+            The current time in UTC, by default the time when this is created
+        """
+        import humanize
+
+        self._naturaldelta = humanize.naturaldelta
+        # There are only a few different dates and naturaldate is the slowest part of formatting a time
+        self._naturaldate = lru_cache(maxsize=None)(humanize.naturaldate)
+        now_timestamp = time.time()
+        self.now = now or datetime.utcfromtimestamp(now_timestamp)
+        self.utc_offset = datetime.fromtimestamp(now_timestamp) - datetime.utcfromtimestamp(now_timestamp)
+
+    def __call__(self, utc_time: Optional[datetime], title: str, delta_first: bool = True) -> str:
+        """Convert a time given by github to a human readable time
+
+        Parameters
+        ----------
+        utc_time : Optional[datetime]
+            The time in UTC
+        title : str
+            What the time is
+        delta_first : bool, optional
+            Whether to show the time that has passed before the date, by default True
+
+        Returns
+        -------
+        str
+            A line with a clock emoji, the title, the time that has passed and the date
+        """
+        if utc_time is None:
+            utc_time = datetime.utcfromtimestamp(0)
+        # Get the clock emoji that most closely matches the time given
+        closest_clock_emoji = get_closest_clock_emoji(utc_time)
+        # Calculate the amount of time that has passed since the time given
+        delta = self._naturaldelta(self.now - utc_time)
+        date = self._naturaldate((utc_time + self.utc_offset).date())
+        # Depending on the use case, the delta may need to be shown before the absolute time
+        if delta_first:
+            return f"{closest_clock_emoji} {title}: {delta} ago ({date})\n"
+        else:
+            return f"{closest_clock_emoji} {title}:{date} ({delta})\n"
 
 
 T = TypeVar("T")
@@ -109,3 +110,25 @@ class cycle(Generic[T]):
 
 def previous(c: cycle[T]) -> T:
     return c.__previous__()
+
+
+if __name__ == "__main__":
+    # Benchmark formatting the three times shown for each of 10k repositories
+    import random
+    import timeit
+
+    randomizer = random.Random(0)
+    repos = [
+        [datetime(2015, 1, 1) + timedelta(seconds=randomizer.randrange(250_000_000)) for _ in range(3)]
+        for _ in range(10_000)
+    ]
+
+    def run() -> None:
+        format_time = TimeFormatter()
+        for created_at, updated_at, pushed_at in repos:
+            format_time(created_at, title="Created At", delta_first=False)
+            format_time(updated_at, title="Last updated")
+            format_time(pushed_at, title="Last pushed")
+
+    total = min(timeit.repeat(run, number=1, repeat=5))
+    print(f"Formatting the times of {len(repos)} repos: {total * 1000:.2f}ms ({total / len(repos) * 10**6:.2f}µs per repo)")
@@ -0,0 +1,143 @@
+"""
+Importing the cli has to stay cheap and free of side effects, since every run of `dracula` pays for it, including
+`dracula --help` and shell completion
+"""
+import json
+import os
+import os.path
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, cache_dir: str, *options: str) -> subprocess.CompletedProcess:
+    """Run python code in a new interpreter, with the cache in its own directory"""
+    env = {**os.environ, "DRACULA_CACHE_DIR": cache_dir, "PYTHONPATH": ROOT}
+    return subprocess.run(
+        [sys.executable, *options, "-c", textwrap.dedent(code)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_has_no_side_effects(tmp_path):
+    cache_dir = tmp_path / "cache"
+    result = run_python(
+        """
+        import json
+        import signal
+        import sys
+
+        sigint_handler = signal.getsignal(signal.SIGINT)
+        excepthook = sys.excepthook
+
+        import dracula._cli
+
+        print(json.dumps({
+            "modules": [name for name in ("requests_cache", "dracula._downloader") if name in sys.modules],
+            "sigint_handler_changed": signal.getsignal(signal.SIGINT) is not sigint_handler,
+            "excepthook_changed": sys.excepthook is not excepthook,
+            "session_created": dracula._cli._session is not None,
+        }))
+        """,
+        str(cache_dir),
+    )
+    state = json.loads(result.stdout)
+    assert state == {
+        "modules": [],
+        "sigint_handler_changed": False,
+        "excepthook_changed": False,
+        "session_created": False,
+    }
+    # Neither the requests cache nor the index are opened
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+
+# The cumulative import time of dracula._cli in microseconds, as reported by python -X importtime. It took about
+# 150ms after the heavy dependencies were moved into the commands, and about 600ms before
+IMPORT_TIME_BUDGET = 400_000
+
+# Dependencies of single commands that every run used to pay for
+HEAVY_MODULES = ("questionary", "prompt_toolkit", "pygments", "humanize", "requests_cache")
+
+
+def test_import_time(tmp_path):
+    result = run_python(
+        f"""
+        import json
+        import sys
+
+        import dracula._cli
+
+        print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))
+        """,
+        str(tmp_path),
+        "-X",
+        "importtime",
+    )
+    assert json.loads(result.stdout) == []
+    # Each line is "import time: self | cumulative | module", with the module indented by it's depth
+    cumulative_times = {
+        module.strip(): int(cumulative)
+        for _, cumulative, module in (
+            line.split("|") for line in result.stderr.splitlines() if line.startswith("import time:")
+        )
+        if cumulative.strip().isdigit()
+    }
+    assert cumulative_times["dracula._cli"] < IMPORT_TIME_BUDGET
+
+
+def test_command_has_no_heavy_imports(tmp_path):
+    # The installed typer may not be compatible with the rich click classes, so the callback and the command are
+    # called the same way typer would instead of parsing the arguments
+    result = run_python(
+        """
+        import json
+        import sys
+
+        import dracula._cli
+        from dracula._commands.all import all as all_command
+
+
+        class Response:
+            status_code = 200
+            links = {}
+
+            def json(self):
+                return [{"name": "vim", "stargazers_count": 1}, {"name": "emacs", "stargazers_count": 2}]
+
+
+        class Session:
+            headers = {}
+
+            def get(self, url, **kwargs):
+                return Response()
+
+
+        dracula._cli.get_session = Session
+        dracula._cli.main(token=None, stale_ok=False, offline=False, refresh=False)
+        all_command(
+            sort="stars",
+            where=[],
+            limit=None,
+            pager=False,
+            tui=False,
+            jobs=8,
+            stream=False,
+            graphql=True,
+            output_format="ndjson",
+            fields="name",
+        )
+        print(json.dumps([name for name in ("pygments", "rich.traceback", "rich.syntax") if name in sys.modules]))
+        """,
+        str(tmp_path),
+    )
+    # The progress bar leaves an empty line behind when the output isn't a terminal
+    *records, modules = filter(None, result.stdout.splitlines())
+    assert records == ['{"name": "emacs"}', '{"name": "vim"}']
+    assert json.loads(modules) == []
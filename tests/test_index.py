@@ -0,0 +1,123 @@
+"""
+Tests for the local index of the dracula repositories and it's incremental refresh
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+import dracula._cli
+from dracula._index import RepoIndex
+from dracula._repo import Repo
+
+START = datetime(2020, 1, 1)
+
+
+def github_time(time: datetime) -> str:
+    return time.isoformat() + "Z"
+
+
+class Response:
+    def __init__(self, status_code, data, has_next_page):
+        self.status_code = status_code
+        self._data = data
+        self.links = {"next": {"url": ""}} if has_next_page else {}
+
+    def json(self):
+        return self._data
+
+
+class Organization:
+    """A fake session for the repositories of the dracula organization, sorted like github does"""
+
+    def __init__(self, count: int):
+        self.repos = {
+            f"app{index:02}": {
+                "name": f"app{index:02}",
+                "stargazers_count": 0,
+                "created_at": github_time(START),
+                "updated_at": github_time(START + timedelta(days=index)),
+                "pushed_at": github_time(START + timedelta(days=index)),
+            }
+            for index in range(count)
+        }
+        self.requests = []
+        self.status_code = 200
+
+    def get(self, url, params):
+        self.requests.append((params["sort"], params["page"]))
+        if self.status_code != 200:
+            return Response(self.status_code, {"message": "Error"}, False)
+        ordered = sorted(self.repos.values(), key=lambda repo: repo[f"{params['sort']}_at"], reverse=True)
+        start = (params["page"] - 1) * params["per_page"]
+        return Response(200, ordered[start : start + params["per_page"]], start + params["per_page"] < len(ordered))
+
+    def star(self, name: str, time: datetime) -> None:
+        self.repos[name]["stargazers_count"] += 1
+        self.repos[name]["updated_at"] = github_time(time)
+
+    def push(self, name: str, time: datetime) -> None:
+        self.repos[name]["pushed_at"] = self.repos[name]["updated_at"] = github_time(time)
+
+
+@pytest.fixture
+def organization(monkeypatch):
+    organization = Organization(60)
+    monkeypatch.setattr(dracula._cli, "get_session", lambda: organization)
+    return organization
+
+
+@pytest.fixture
+def index(tmp_path, organization):
+    index = RepoIndex(str(tmp_path / "index.sqlite"))
+    index.replace(Repo.from_rest(repo) for repo in organization.repos.values())
+    organization.requests.clear()
+    return index
+
+
+def test_replace(index):
+    assert index.is_complete()
+    assert len(index.repos()) == 60
+    assert index.get("APP01").name == "app01"
+    assert index.get("missing") is None
+    assert index.latest("pushed_at") == START + timedelta(days=59)
+
+
+def test_clear(index):
+    index.clear()
+    assert not index.is_complete()
+    assert index.repos() == []
+    assert index.latest("pushed_at") is None
+
+
+def test_update_without_changes(index, organization):
+    dracula._cli._update_index(index)
+    # The first page of each order already has a repository that is up to date
+    assert organization.requests == [("pushed", 1), ("updated", 1)]
+
+
+def test_update_stops_at_up_to_date_page(index, organization):
+    now = datetime(2022, 1, 1)
+    for position in range(30):
+        organization.push(f"app{position:02}", now + timedelta(minutes=position))
+    dracula._cli._update_index(index)
+    assert organization.requests == [("pushed", 1), ("pushed", 2), ("updated", 1), ("updated", 2)]
+    assert index.latest("pushed_at") == now + timedelta(minutes=29)
+
+
+def test_update_both_orders(index, organization):
+    # Starring only changes when a repository was updated, a push changes both, and the push is newer than every star
+    now = datetime(2022, 1, 1)
+    for position in range(25):
+        organization.star(f"app{position:02}", now + timedelta(minutes=position))
+    organization.push("app30", now + timedelta(hours=1))
+    dracula._cli._update_index(index)
+    assert sum(repo.stars for repo in index.repos()) == 25
+    assert index.get("app30").pushed_at == now + timedelta(hours=1)
+
+
+def test_update_error(index, organization):
+    organization.status_code = 403
+    organization.star("app00", datetime(2022, 1, 1))
+    dracula._cli._update_index(index)
+    assert organization.requests == [("pushed", 1)]
+    assert index.get("app00").stars == 0
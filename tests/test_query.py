@@ -0,0 +1,127 @@
+"""
+Tests for the --where and --sort options of the `all` command
+"""
+import random
+from datetime import datetime
+
+import pytest
+import typer
+
+from dracula._query import parse_condition, parse_sort, select
+from dracula._repo import Repo
+
+NOW = datetime(2022, 6, 1)
+
+
+def make_repo(name: str, **fields) -> Repo:
+    defaults = dict(
+        description=None,
+        size=0,
+        stars=0,
+        forks=0,
+        watchers=0,
+        language=None,
+        issues=0,
+        license=None,
+        created_at=None,
+        updated_at=None,
+        pushed_at=None,
+        default_branch=None,
+    )
+    return Repo(name=name, **{**defaults, **fields})
+
+
+def test_age_condition():
+    condition = parse_condition("pushed<1y", now=NOW)
+    assert condition(make_repo("recent", pushed_at=datetime(2022, 1, 1)))
+    assert not condition(make_repo("old", pushed_at=datetime(2020, 1, 1)))
+    assert not condition(make_repo("never"))
+
+
+def test_older_than_age_condition():
+    condition = parse_condition("pushed>=2y", now=NOW)
+    assert condition(make_repo("old", pushed_at=datetime(2019, 1, 1)))
+    assert not condition(make_repo("recent", pushed_at=datetime(2022, 1, 1)))
+
+
+def test_date_prefix_condition():
+    condition = parse_condition("created=2019")
+    assert condition(make_repo("start", created_at=datetime(2019, 1, 1)))
+    assert condition(make_repo("end", created_at=datetime(2019, 12, 31, 23, 59)))
+    assert not condition(make_repo("later", created_at=datetime(2020, 1, 1)))
+    assert not condition(make_repo("never"))
+
+    condition = parse_condition("created!=2019")
+    assert condition(make_repo("later", created_at=datetime(2020, 1, 1)))
+    assert condition(make_repo("never"))
+    assert not condition(make_repo("start", created_at=datetime(2019, 1, 1)))
+
+
+def test_language_conditions():
+    # Languages are matched case insensitively and by their aliases
+    condition = parse_condition("language=vim")
+    assert condition(make_repo("vim", language="Vim Script"))
+    assert not condition(make_repo("emacs", language="Emacs Lisp"))
+    assert not condition(make_repo("none"))
+
+    condition = parse_condition("language!=vim")
+    assert condition(make_repo("emacs", language="Emacs Lisp"))
+    assert condition(make_repo("none"))
+    assert not condition(make_repo("vim", language="Vim Script"))
+
+
+def test_number_condition():
+    condition = parse_condition("stars >= 100")
+    assert condition(make_repo("popular", stars=100))
+    assert not condition(make_repo("unpopular", stars=99))
+
+
+@pytest.mark.parametrize("expression", ["stars", "unknown>1", "stars>many", "created<yesterday"])
+def test_invalid_condition(expression):
+    with pytest.raises(typer.BadParameter):
+        parse_condition(expression)
+
+
+def test_sort_by_name():
+    repos = [make_repo("vim"), make_repo("Alacritty"), make_repo("emacs")]
+    assert [repo.name for repo in sorted(repos, key=parse_sort("name"))] == ["Alacritty", "emacs", "vim"]
+    assert [repo.name for repo in sorted(repos, key=parse_sort("-name"))] == ["vim", "emacs", "Alacritty"]
+
+
+def test_sort_missing_values_last():
+    repos = [make_repo("never"), make_repo("old", pushed_at=datetime(2019, 1, 1)), make_repo("new", pushed_at=NOW)]
+    assert [repo.name for repo in sorted(repos, key=parse_sort("pushed"))] == ["new", "old", "never"]
+    assert [repo.name for repo in sorted(repos, key=parse_sort("+pushed"))] == ["old", "new", "never"]
+
+
+def test_sort_by_multiple_fields():
+    repos = [make_repo("b", stars=1), make_repo("a", stars=1), make_repo("c", stars=2)]
+    assert [repo.name for repo in sorted(repos, key=parse_sort("stars,name"))] == ["c", "a", "b"]
+
+
+def test_select():
+    repos = [
+        make_repo("vim", stars=5, language="Vim Script"),
+        make_repo("emacs", stars=3, language="Emacs Lisp"),
+        make_repo("neovim", stars=4, language="Vim Script"),
+    ]
+    selected = select(repos, [parse_condition("language=vim")], parse_sort("stars"))
+    assert [repo.name for repo in selected] == ["vim", "neovim"]
+
+
+@pytest.mark.parametrize("sort", ["stars", "-name", "pushed,name", "language,-forks"])
+def test_limit_matches_full_sort(sort):
+    randomizer = random.Random(0)
+    languages = [None, "Python", "Vim Script", "Lua"]
+    repos = [
+        make_repo(
+            f"app{index}",
+            stars=randomizer.randrange(10),
+            forks=randomizer.randrange(3),
+            language=randomizer.choice(languages),
+            pushed_at=randomizer.choice([None, datetime(2020, 1, 1), datetime(2021, 1, 1)]),
+        )
+        for index in range(200)
+    ]
+    key = parse_sort(sort)
+    assert select(repos, [], key, limit=10) == select(repos, [], key)[:10]